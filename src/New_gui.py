@@ -20,10 +20,13 @@ import tkinter as tk
 from tkinter import filedialog as fd
 from tkinter import ttk
 import os
+import time
 from PIL import Image
 from PIL import ImageTk 
 from grid import Grid
 from map import MapControl
+from map_cache import MapCache
+from renderer import SPRITES
 from agents import model
 from config import ConfigManager
 from tkinter import messagebox as mb
@@ -58,12 +61,23 @@ class App(tk.Tk):
         self.animation_job = None
         self.can_spawn = False
         self.cell_count = 50
+        self.map_cache = MapCache() # processed maps on disk, keyed on the shapefile hash
 
         # varibles for selection
         self.mouse_start_x = 0
         self.mouse_start_y = 0
         self.can_select = False
         self.step_interval = 20  # ms, default step interval
+        # turbo runs several model steps per frame and only draws the last one
+        # speed is a real time factor, 1x is one step per step_interval
+        self.turbo = tk.BooleanVar(value=False)
+        self.turbo_factor = 10
+        self.turbo_frame_ms = 33       # ms between drawn frames
+        self.turbo_budget_ms = 25      # wall time a frame may spend stepping
+        self.turbo_max_steps = 1000    # K, most steps run in one frame
+        self.turbo_due = 0.0           # steps owed to keep up with the factor
+        self.turbo_last = None         # perf_counter of the last turbo frame
+        self.in_turbo_frame = False
 
         # Handle spawn position data
         # dont change this unless you tell me
@@ -123,6 +137,11 @@ class App(tk.Tk):
         self.reset_sim_button.grid(row=0, column=1, padx=10, pady=5)
         self.exit_sim_button.grid(row=1, column=0, padx=10, pady=5, sticky="ew")
         self.analysis_button.grid(row=1, column=1, padx=10, pady=5)
+        self.turbo_check = tk.Checkbutton(self.sub_sim_section, text="Turbo", variable=self.turbo, command=self.on_turbo_toggle, font=("Arial", 12))
+        self.turbo_scale = tk.Scale(self.sub_sim_section, from_=1, to=200, orient='horizontal', label='Speed (x)', showvalue=True, length=120, command=self.set_turbo_factor)
+        self.turbo_scale.set(self.turbo_factor)
+        self.turbo_check.grid(row=2, column=0, padx=10, pady=5)
+        self.turbo_scale.grid(row=2, column=1, padx=10, pady=5)
         self.save_button = tk.Button(self.sub_config_section, text="Save Config", bg="#333333", fg="white", width=10, height=1, font=("Arial", 12), relief="raised", command=self.save_config_dialog)
         self.load_button = tk.Button(self.sub_config_section, text="Load Config", bg="#333333", fg="white", width=10, height=1, font=("Arial", 12), relief="raised",  command=self.load_config_dialog)
         #Need to make an additional sub frame to stack the slider and the coord label correctly
@@ -189,6 +208,7 @@ class App(tk.Tk):
             color: fill color string (e.g. '#C60707' or 'green').
             """
             radius = 5
+            icon_path = None # no sprite for this type, draw the oval
             if icon.lower() == "seeker":
                 icon_path = UUV_path
             elif icon.lower() == "target":
@@ -199,14 +219,8 @@ class App(tk.Tk):
             # ensure canvas exists
             if not hasattr(self, "canvas") or self.canvas is None:
                 raise RuntimeError("Canvas not initialized; cannot draw spawn marker")
-            try:
-                img = Image.open(icon_path)  
-                img = img.resize((20, 20), Image.Resampling.LANCZOS)  # change size here
-                icon = ImageTk.PhotoImage(img)
-                self.agent_images.append(icon)  # <-- This keeps the image alive
-            except Exception as e:
-                print("Error loading agent icon:", e)
-                icon = None
+            # same shared sprite the agents use once the model runs
+            icon = SPRITES.get(icon_path, (20, 20))
 
             if icon is not None:
                 item_id = self.canvas.create_image(
@@ -548,9 +562,10 @@ class App(tk.Tk):
             shape_path=self.map_file_path,
             canvas=self.canvas,
             shallow_color=self.map_shallow_color,
-            deep_color=self.map_deep_color
+            deep_color=self.map_deep_color,
+            cache=self.map_cache
         )
-        self.map_grid = Grid(width=self.canvas_size[0], height=self.canvas_size[1], cells_n=self.cell_count, canvas=self.canvas)
+        self.map_grid = Grid(width=self.canvas_size[0], height=self.canvas_size[1], cells_n=self.cell_count, canvas=self.canvas, map=self.current_map)
         self.canvas.config(background="#0A7005")
         # self.canvas.unbind("<Button-1>")
 
@@ -640,8 +655,6 @@ class App(tk.Tk):
                 # Check if this spawn position already has an agent
                 if pos not in existing_spawn_positions:
                     # This is a new agent - create it
-                    print(f"Creating new {agent_type} at {pos}")
-                    
                     if agent_type == "GA":
                         # GA agents create multiple instances per position
                         group_id = len([a for a in self.mesa_model.agents 
@@ -700,13 +713,73 @@ class App(tk.Tk):
 
     def animate(self):
         '''animate the screen'''
+        if self.in_turbo_frame:
+            return  # restarted from inside a step (GA model reset), the running frame reschedules
         if self.is_running and self.mesa_model is not None:
-            self.mesa_model.step()
+            if self.turbo.get():
+                self.turbo_frame()
+            else:
+                self.mesa_model.step()
             # step through the model
-            self.animation_job = self.after(self.step_interval, self.animate)
+            if self.is_running:
+                self.schedule_next()
         else:
             self.animation_job = None
 
+    def schedule_next(self):
+        """Queue the next animate call, dropping any already queued so only one loop runs"""
+        if self.animation_job:
+            try:
+                self.after_cancel(self.animation_job)
+            except Exception:
+                pass
+        delay = self.turbo_frame_ms if self.turbo.get() else self.step_interval
+        self.animation_job = self.after(delay, self.animate)
+
+    def turbo_frame(self):
+        """Run the steps owed for the turbo speed, bounded by turbo_max_steps and turbo_budget_ms, then draw once"""
+        now = time.perf_counter()
+        elapsed = (now - self.turbo_last) if self.turbo_last is not None else self.turbo_frame_ms / 1000
+        elapsed = min(elapsed, 0.25)  # after a pause, don't try to catch up the paused time
+        self.turbo_last = now
+        # 1x is one step every step_interval ms
+        self.turbo_due += self.turbo_factor * elapsed * 1000 / self.step_interval
+        due = min(int(self.turbo_due), self.turbo_max_steps)
+
+        renderer = self.mesa_model.renderer
+        renderer.hold()
+        deadline = now + self.turbo_budget_ms / 1000
+        done = 0
+        self.in_turbo_frame = True
+        try:
+            while done < due and self.is_running and self.mesa_model is not None:
+                self.mesa_model.step()
+                done += 1
+                if time.perf_counter() >= deadline:
+                    break
+        finally:
+            self.in_turbo_frame = False
+            renderer.flush()
+        if done < due:
+            # can't keep up, run flat out instead of piling up a backlog
+            self.turbo_due = 0.0
+        else:
+            self.turbo_due -= done
+
+    def on_turbo_toggle(self):
+        """Switch between one step per tick and turbo frames"""
+        self.turbo_due = 0.0
+        self.turbo_last = None
+        if self.is_running:
+            self.schedule_next()
+
+    def set_turbo_factor(self, value):
+        """Real time factor for turbo mode, from the speed slider"""
+        try:
+            self.turbo_factor = max(1, int(value))
+        except Exception:
+            return
+
     # Helper function to change the current step interval (argument taken by the animation job)
     # in order to more easily set the current step speed of the program i.e how fast the sim moves
     def set_step_interval(self, ms):
@@ -720,15 +793,8 @@ class App(tk.Tk):
         self.step_interval = ms
 
         if self.is_running:
-            # cancel pending after and schedule a new one with updated interval
-            if self.animation_job:
-                try:
-                    self.after_cancel(self.animation_job)
-                except Exception:
-                    pass
-                self.animation_job = None
             # schedule next tick with new interval
-            self.animation_job = self.after(self.step_interval, self.animate)
+            self.schedule_next()
 
     # Method used to create popup windows, currently takes argument "choice" and will either open
     # UAV select window or the analysis window
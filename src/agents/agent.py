@@ -16,25 +16,22 @@
 # - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
 # - Prof. Hang Dinh, CIS, Indiana University South Bend
 
-import tkinter as tk
 import numpy as np
-import heapq
 import pandas as pd
 import mesa
 import geopandas as gpd
 from shapely.geometry import Point, shape
 
-from PIL import Image, ImageTk
-
 import os
 #print(os.getcwd())
 #print("CWD printed for debug") #comments for debug
 icon_path = os.path.join(os.getcwd(), "resources", "EnemyUUV.png")
+destroyed_icon_path = os.path.join(os.getcwd(), "resources", "DestroyedEnemyUUV.png")
 #print(icon_path)
 
 #user defined
 from map import MapControl
-from cell import Cell
+from kinematics import SEEK
 
 from salinity import Salinity
 from temperature import Temperature
@@ -43,12 +40,13 @@ class UUVAgent(mesa.Agent):                         #AS OF 11/14/25 Mike has add
     """UUV agent testing class"""
     DEFAULT_COLOR = "#FD0202"
     SPRITE_PATH = icon_path
-    def __init__(self, model, spawn, map, canvas, grid, *args, **kwargs):
+    DESTROYED_SPRITE_PATH = destroyed_icon_path
+    RENDER_TAG = "agent"
+    def __init__(self, model, spawn, map, grid, *args, **kwargs):
         super().__init__(model, *args, **kwargs)
         #Spawn variable
         self.spawn = spawn
         self.is_complete = False
-        self.Speed = 1  # This value is multiplied by the added unit movement in x and y per step
         self.status = True  # for cuuv to kill the UUV >:}
 
         #Calculate cell size (used for pathfinding)
@@ -57,128 +55,71 @@ class UUVAgent(mesa.Agent):                         #AS OF 11/14/25 Mike has add
         else:
             self.cell_size = 14  # fallback
 
-        # Set a default destination - will be updated in first step()
-        self.dest = [9, 33]  # fallback destination
+        # straight line target cell, only set when there is no water route
+        self.dest = None
 
-        #Assign position to the grid via the spawn location 
-        self.position = [grid[spawn[1]][spawn[0]].pos_x, grid[spawn[1]][spawn[0]].pos_y]
+        #Assign position to the grid via the spawn location, position and Speed live in the model kinematics
+        # Speed is multiplied by the added unit movement in x and y per step
+        self.slot = self.model.kinematics.add(
+            self, [grid[spawn[1]][spawn[0]].pos_x, grid[spawn[1]][spawn[0]].pos_y], speed=1, mode=SEEK
+        )
         #Set up salinity and temperature
         self.salinity = Salinity()
         self.temp = Temperature()
 
-        # tkinter gui variables (color,map,canvas,oval on map,lifting)
+        # gui variables (color,map), drawing is done by the model renderer
         self.color = kwargs.get('color', self.DEFAULT_COLOR)
         self.map = map
-        self.canvas = canvas
-        #self.oval = self.canvas.create_oval(self.position[0]-5,self.position[1]-5, self.position[0]+5, self.position[1]+5, fill=self.color, tags='agent')
-        #self.canvas.lift(self.oval)
-        #Commented out for icons
-
-      
-        try:
-            img = Image.open(icon_path)  
-            img = img.resize((20, 20), Image.Resampling.LANCZOS)  # change size here
-            self.icon = ImageTk.PhotoImage(img)
-        except Exception as e:
-            print("Error loading agent icon:", e)
-            self.icon = None
-
-        if self.icon is not None:
-            self.sprite = self.canvas.create_image(
-            self.position[0], 
-            self.position[1], 
-            image=self.icon,
-            tags="agent"
-        )
-        else:
-            # fallback: draw oval if icon fails
-            self.sprite = self.canvas.create_oval(
-            self.position[0]-5, self.position[1]-5,
-            self.position[0]+5, self.position[1]+5,
-            fill=self.color,
-            tags="agent"
-        )
-        self.canvas.lift(self.sprite)
         # depth varibles
         self.depth_preferd = [10, 20]
         self.depth_min = 5
         self.depth_max = 30
 
         # Search parameters
-        self.grid = np.array(grid)
-        self.ROW, self.COL = self.grid.shape
+        self.ROW, self.COL = grid.shape
         self.grid = grid
-        self.path = None
+        # flow field state, cell is the last grid cell we reached
+        self.on_field = False
+        self.cell = (spawn[1], spawn[0])
+        self.target_distance = float('inf')  # water distance to the nearest target in pixels
 
-        #Grid and A* debug
-        self.a_star_search()
-        #print(f"Grid shape: {self.ROW} x {self.COL}")
-        #print(f"Running A* from {spawn} to {self.dest}")
-        #print(f"A* path result: {self.path}")
+        # hold still on the spawn cell, the first step heads out along the target field
+        self.next_target = self.grid[spawn[1]][spawn[0]]
 
-        # Check if agent has a path, if not fallback to the direct destination (either the initalized taget)
-        # or the hard coded fallback cell
-        if self.path is None or len(self.path) == 0:
-            # print(f"No path found or path empty, using direct destination")
-            tmp = self.grid[self.dest[0]][self.dest[1]]
-            self.next_target = tmp
-            # print(f"Next target (direct): pos_x={tmp.pos_x}, pos_y={tmp.pos_y}")
-        else:
-            tmp = self.path[0]
-            self.next_target = self.grid[tmp[0]][tmp[1]]
-            # print(f"Next target from path[0]: {tmp} -> pos_x={self.next_target.pos_x}, pos_y={self.next_target.pos_y}")
+        self.model.renderer.agent_added(self)
 
-        # Debug
-        #print(f"=== END SEEKER INIT DEBUG ===\n")
-        #print(spawn, " Debugging spawn")
+    @property
+    def position(self):
+        """View of our row in the model kinematics arrays"""
+        return self.model.kinematics.pos[self.slot]
 
-    #Method used to get the direction to the target
-    def getTargetDir(self):
-        #Grab target position
-        target_x = self.next_target.pos_x
-        target_y = self.next_target.pos_y
-        #print(f'target: {target_x}x{target_y}') DEBUGGGG
-        # print(f'pos:{self.position}')
-        # Calculate our new x and y position based on the targets position and our current position
-        new_x = target_x - self.position[0]
-        new_y = target_y - self.position[1]
-        new_vector = np.array([new_x, new_y])
-        magnitude = np.linalg.norm(new_vector)
-        unit_vector =0
+    @position.setter
+    def position(self, xy):
+        self.model.kinematics.pos[self.slot] = xy
 
-        #get the next depth
-        # current_depth = self.map.depth_loc(x=self.position[0], y=self.position[1])
+    @property
+    def prev_position(self):
+        """Where we were before this step's move"""
+        return self.model.kinematics.prev_pos[self.slot]
+
+    @property
+    def Speed(self):
+        return float(self.model.kinematics.speed[self.slot])
+
+    @Speed.setter
+    def Speed(self, value):
+        self.model.kinematics.speed[self.slot] = value
+
+    @property
+    def next_target(self):
+        """Cell we are heading for, the kinematics waypoint follows it"""
+        return self._next_target
+
+    @next_target.setter
+    def next_target(self, cell):
+        self._next_target = cell
+        self.model.kinematics.set_waypoint(self.slot, (cell.pos_x, cell.pos_y))
 
-        # print(f'mag:{magnitude}')
-       
-        if(magnitude == 0):
-            if not self.path:
-                 #Check if the taget is destroyed 
-                # print("target is destroyed")
-                #Set our unit vector to 0 to stop movement
-                unit_vector = [0, 0]
-                self.reset()
-                return unit_vector
-            else:
-                #Pops the wayoint from the path
-                self.path.pop(0)
-                # Defensive: check if path is empty before accessing
-                if not self.path or len(self.path) == 0:
-                    #If path is empty return 0 (to stop movement)
-                    # print("No path available")
-                    return [0, 0]
-                #If waypoints remain, set the next target to the waypoint
-                tmp = self.path[0]
-                self.next_target = self.grid[tmp[0]][tmp[1]]
-                # print(f'next target: {self.next_target}')
-                #Return 0 still for this step, agent will move to target on next step
-                unit_vector = [0, 0]
-        else:
-            #If magnitude isnt 0, calculate new unit vector for movement
-            unit_vector = new_vector / magnitude
-        # print(f'unitvector{unit_vector}')
-        return unit_vector
-    
     #Step function that is used to move the agent towards its target
     def step(self):
         """simple move towards target set function"""
@@ -186,79 +127,38 @@ class UUVAgent(mesa.Agent):                         #AS OF 11/14/25 Mike has add
         if not self.status:
             return
         
-        # Update target destination dynamically
-        targets = self.model.get_target_positions()
+        # Water distance field toward every live target, shared by all seekers
+        field = self.model.get_target_field()
 
         # NO TARGETS REMAIN - STOP MOVEMENT
-        if not targets:
+        if field is None:
             # print(f"Agent {self.unique_id} stopping - no valid targets remain")
+            if not self.is_complete:
+                #Change color to indicate idle state
+                self.model.renderer.agent_changed(self, "finished")
             self.is_complete = True
-            #Change color to indicate idle state
-            try:
-                self.canvas.itemconfig(self.oval, fill="gray")
-            except Exception:
-                pass
+            self.model.agent_finished(self)
+            self.model.kinematics.set_moving(self.slot, False)
             return  # Exit step() - don't move
-
-        # Find closest target to current position
-        closest_target = None
-        min_distance = float('inf')
-        
-        for target in targets:
-            target_pixel_x = target[0]
-            target_pixel_y = target[1]
-            
-            # Calculate distance from current position to this target
-            distance = ((target_pixel_x - self.position[0])**2 + 
-                    (target_pixel_y - self.position[1])**2)**0.5
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_target = target
-        
-        # Use the closest target
-        target_pixel_x = closest_target[0]
-        target_pixel_y = closest_target[1]
-        
-        target_grid_col = int(target_pixel_x / self.cell_size)
-        target_grid_row = int(target_pixel_y / self.cell_size)
-        new_dest = [target_grid_row, target_grid_col]
-        
-        # Update if target moved OR if next_target is invalid
-        if self.dest != new_dest or not hasattr(self, 'next_target') or self.next_target is None:
-            old_dest = self.dest
-            self.dest = new_dest
-            
-            # UPDATE next_target to point to the new destination cell
-            try:
-                self.next_target = self.grid[new_dest[0]][new_dest[1]]
-                print(f"Updated next_target to grid[{new_dest[0]}][{new_dest[1]}]: pos=({self.next_target.pos_x}, {self.next_target.pos_y})")
-            except Exception as e:
-                print(f"ERROR: Could not update next_target: {e}")
-                return
-            
-            # In the future, if targets can move, show where it moved to
-            if self.dest != old_dest:
-                print(f"Target moved from {old_dest} to {self.dest}")
-        
-        # Get our new direction by getting the direction to the target
-        new_direction = self.getTargetDir()
-        
-        # Check if we're still moving
-        if new_direction is None or (new_direction[0] == 0 and new_direction[1] == 0):
-            # print(f"Agent {self.unique_id} stopped - no valid direction")
-            return
-        
-        # Obtain our new coordinates via our speed * our direction
-        new_x = self.Speed * (np.round(new_direction[0]).astype(int))
-        new_y = self.Speed * (np.round(new_direction[1]).astype(int))
-        
-        # Set our position to our new coordinates
-        self.position = np.array([self.position[0] + new_x, self.position[1] + new_y])
-        # Move the canvas oval in proportion
-        #self.canvas.move(self.oval, new_x, new_y)     
-       #no more oval 
-        self.canvas.move(self.sprite, new_x, new_y)
+        self.model.kinematics.set_moving(self.slot, True)
+
+        if not self.on_field:
+            # first step on the field, start from the cell we are in
+            self.cell = self.nearest_cell()
+            self.next_target = self.grid[self.cell[0]][self.cell[1]]
+            self.on_field = True
+
+        if self.model.kinematics.at_waypoint(self.slot):
+            # reached the cell, ask the field where to go next
+            self.cell = (self.next_target.row, self.next_target.col)
+            self.target_distance = field.distance(self.cell[0], self.cell[1]) * self.cell_size
+            nxt = field.next_step(self.cell[0], self.cell[1])
+            if nxt is None:
+                # no water route to any target, head straight for the closest one
+                nxt = self.closest_target_cell()
+            self.next_target = self.grid[nxt[0]][nxt[1]]
+
+        # the move itself happens for every agent at once in the model kinematics pass
         
         # Salinity data
         """"
@@ -283,121 +183,20 @@ class UUVAgent(mesa.Agent):                         #AS OF 11/14/25 Mike has add
         
         #print(f"=== END AGENT {self.unique_id} STEP ===\n")
     """
-    #A star search algorithm
-    def a_star_search(self):
-        """A* seach algorithum"""
-                # Check if the source and destination are valid
-        if not self.is_valid(self.spawn[0], self.spawn[1]) or not self.is_valid(self.dest[0], self.dest[1]):
-            print("Source or destination is invalid")
-            return
-
-        # Check if the source and destination are unblocked
-        if not self.is_unblocked(self.spawn[0], self.spawn[1]) or not self.is_unblocked(self.dest[0], self.dest[1]):
-            print("Source or the destination is blocked")
-            return
-
-        # Check if we are already at the destination
-        if self.is_destination(self.spawn[0], self.spawn[1]):
-            print("We are already at the destination")
-            return
-
-        # Initialize the closed list (visited cells)
-        closed_list = [[False for _ in range(self.COL)] for _ in range(self.ROW)]
-        # Initialize the details of each cell
-        cell_details = [[Cell(id=0) for _ in range(self.COL)] for _ in range(self.ROW)]
-
-        # Initialize the start cell details
-        i = self.spawn[0]
-        j = self.spawn[1]
-        cell_details[i][j].f = 0
-        cell_details[i][j].g = 0
-        cell_details[i][j].h = 0
-        cell_details[i][j].parent_row_i = i
-        cell_details[i][j].parent_col_j = j
-
-        # # Initialize the open list (cells to be visited) with the start cell
-        open_list = []
-        heapq.heappush(open_list, (0.0, i, j))
-
-        # # Initialize the flag for whether destination is found
-        found_dest = False
-
-        # # Main loop of A* search algorithm
-        while len(open_list) > 0:
-            # Pop the cell with the smallest f value from the open list
-            p = heapq.heappop(open_list)
-
-            # Mark the cell as visited
-            i = p[1]
-            j = p[2]
-            closed_list[i][j] = True
-
-            # For each direction, check the successors
-            directions = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
-            for dir in directions:
-                new_i = i + dir[0]
-                new_j = j + dir[1]
-
-                # If the successor is valid, unblocked, and not visited
-                if self.is_valid(new_i, new_j) and self.is_unblocked(new_i, new_j) and not closed_list[new_i][new_j]:
-                    # If the successor is the destination
-                    if self.is_destination(new_i, new_j):
-                        # Set the parent of the destination cell
-                        cell_details[new_i][new_j].parent_row_i = i
-                        cell_details[new_i][new_j].parent_col_j = j
-                        print("The destination cell is found")
-                        # Trace and print the path from source to destination
-                        self.trace_path(cell_details, self.dest)
-                        found_dest = True
-                        return
-                    else:
-                        # Calculate the new f, g, and h values
-                        g_new = cell_details[i][j].g + 1.0
-                        h_new = self.calculate_h_value(new_i, new_j)
-                        f_new = g_new + h_new
-
-                        # If the cell is not in the open list or the new f value is smaller
-                        if cell_details[new_i][new_j].f == float('inf') or cell_details[new_i][new_j].f > f_new:
-                            # Add the cell to the open list
-                            heapq.heappush(open_list, (f_new, new_i, new_j))
-                            # Update the cell details
-                            cell_details[new_i][new_j].f = f_new
-                            cell_details[new_i][new_j].g = g_new
-                            cell_details[new_i][new_j].h = h_new
-                            cell_details[new_i][new_j].parent_row_i = i
-                            cell_details[new_i][new_j].parent_col_j = j
-
-        # If the destination is not found after visiting all cells
-        if not found_dest:
-            self.path = [0, 0]
-            print("Failed to find the destination cell")
-
-    #Helper function of the A* algorithm to trace the movement
-    def trace_path(self, cell_details, dest):
-        """Trace the movement of the a*"""
-        # print("The Path is ")
-        path = []
-        row = dest[0]
-        col = dest[1]
-
-        # Trace the path from destination to source using parent cells
-        while not (cell_details[row][col].parent_row_i == row and cell_details[row][col].parent_col_j == col):
-            path.append((row, col))
-            temp_row = cell_details[row][col].parent_row_i
-            temp_col = cell_details[row][col].parent_col_j
-            row = temp_row
-            col = temp_col
-
-        # Add the source cell to the path
-        path.append((row, col))
-        # Reverse the path to get the path from source to destination
-        path.reverse()
-        self.path = path
-
-        # Print the path
-        # for i in path:
-        #     print("->", i, end=" ")
-        # print()
+    def nearest_cell(self):
+        """(row, col) of the grid cell closest to our position"""
+        col = int(np.abs(self.grid.xs - self.position[0]).argmin())
+        row = int(np.abs(self.grid.ys - self.position[1]).argmin())
+        return (row, col)
+
+    def closest_target_cell(self):
+        """(row, col) of the straight line closest live target"""
+        # the model assigns every seeker its nearest target in one pass per step
+        index = self.model.nearest_target(self)
+        if index is None:
+            return self.cell
+        self.dest = self.model.target_cells[index].tolist()
+        return self.dest
 
     #Helper to check if a cell is valid (in the bounds)
     def is_valid(self, row, col):
@@ -407,41 +206,19 @@ class UUVAgent(mesa.Agent):                         #AS OF 11/14/25 Mike has add
     # Helper to check if a cell is unblocked
     def is_unblocked(self, row, col):
         """check if cell is unblocked"""
-        return self.grid[row][col].id != 1
-
-    #Check if the cell is the destination
-    def is_destination(self, row, col):
-        """check if cell is the destination"""
-        return row == self.dest[0] and col == self.dest[1]
-
-    #calculate the guess value of a cell, Euclidean
-    def calculate_h_value(self, row, col):
-        """calculate the guess value of a cell, Euclidean"""
-        return ((row - self.dest[0]) ** 2 + (col - self.dest[1]) ** 2) ** 0.5
+        return self.grid.water[row, col] == 1
 
-    # Cleanup function called by reset sim to clear the oval
+    # Cleanup function called by reset sim to clear the sprite
     def cleanup(self):
-        """Remove canvas items created by this agent."""
-        try:
-            if hasattr(self, "oval") and self.oval is not None:
-                try:
-                    self.canvas.delete(self.oval)
-                except Exception:
-                    pass
-#For sprites, no longer ovals
-            if hasattr(self, "sprite") and self.sprite is not None:
-                try:
-                    self.canvas.delete(self.sprite)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        """Remove anything drawn for this agent."""
+        self.model.renderer.agent_removed(self)
 
     def reset(self):
         """Reset the agent for another run"""
         print("i am reseting")
         spawn = self.spawn
         self.position = [self.grid[spawn[1]][spawn[0]].pos_x, self.grid[spawn[1]][spawn[0]].pos_y]
-        tmp = self.path[0]
-        self.next_target = self.grid[tmp[0]][tmp[1]]
-        self.status = True
\ No newline at end of file
+        self.next_target = self.grid[spawn[1]][spawn[0]]
+        self.model.agent_restored(self)
+        self.on_field = False
+        self.model.renderer.agent_moved(self)
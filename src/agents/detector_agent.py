@@ -16,7 +16,6 @@
 # - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
 # - Prof. Hang Dinh, CIS, Indiana University South Bend
 
-import tkinter as tk
 import numpy as np
 import heapq
 import pandas as pd
@@ -27,8 +26,6 @@ from .CounterUUVAgent import CUUVAgent
 from .agent import UUVAgent
 import matplotlib.pyplot as plt
 
-from PIL import Image, ImageTk
-
 import os
 icon_path = os.path.join(os.getcwd(), "resources", "Detector.png")
 
@@ -41,9 +38,11 @@ class DetectorAgent(mesa.Agent):
     '''Detector Agentt for a sensor'''
     DEFAULT_COLOR = "#FFFFFF"
     SPRITE_PATH = icon_path
+    RENDER_TAG = "agent"
+    SHOW_RADIUS = True
 
     # keep in mind that the spawns pos(x,y) are flipped
-    def __init__(self, model, spawn, map, canvas, grid, *args, **kwargs):
+    def __init__(self, model, spawn, map, grid, *args, **kwargs):
         super().__init__(model, *args, **kwargs)
         # Target and spawn
         
@@ -56,50 +55,13 @@ class DetectorAgent(mesa.Agent):
 
         # varibles
         self.radius = 20
+        self.sigma = 10 # rayleigh detection falloff
         self.is_triggerd = False
+        self.detected_step = None # model step of the first detection, used for batch summaries
     
-        # tkinter gui
+        # gui, drawing is done by the model renderer
         self.color = kwargs.get('color', self.DEFAULT_COLOR)
         self.map = map
-        self.canvas = canvas
-        #self.oval = self.canvas.create_oval(
-        #    self.position[0] - 5, self.position[1] - 5,
-        #    self.position[0] + 5, self.position[1] + 5,
-        #    fill=self.color, tags='agent'
-        #)
-
-        try:
-            img = Image.open(icon_path)  
-            img = img.resize((20, 20), Image.Resampling.LANCZOS)  # change size here
-            self.icon = ImageTk.PhotoImage(img)
-        except Exception as e:
-            print("Error loading agent icon:", e)
-            self.icon = None
-
-        if self.icon is not None:
-            self.sprite = self.canvas.create_image(
-            self.position[0], 
-            self.position[1], 
-            image=self.icon,
-            tags="agent"
-        )
-        else:
-            # fallback: draw oval if icon fails
-            self.sprite = self.canvas.create_oval(
-            self.position[0]-5, self.position[1]-5,
-            self.position[0]+5, self.position[1]+5,
-            fill=self.color,
-            tags="agent"
-        )
-        self.canvas.lift(self.sprite)
-
-        self.radius_oval = self.canvas.create_oval(
-            self.position[0] - self.radius, self.position[1] - self.radius,
-            self.position[0] + self.radius, self.position[1] + self.radius,
-            outline=self.radius_color, fill='', dash=(3, 3), tags='agent'
-        )
-        #self.canvas.lift(self.oval)
-        self.canvas.lift(self.radius_oval)
 
         self.Used = False
 
@@ -107,56 +69,32 @@ class DetectorAgent(mesa.Agent):
         # self.fig, self.ax = plt.subplots()
         self.scatter = None
 
+        self.model.renderer.agent_added(self)
+
     def step(self):
-        if self.Used:
-            return
+        # the model senses for every detector at once, this is the same pass for just us
+        self.model.sensing.sense([self])
 
-        Detection = self.detect()
-        
-        current_step = self.model.schedule.steps if hasattr(self.model, 'schedule') else 0
-        steps_since_spawn = current_step - self.last_spawn_step
-        
-        if Detection and not self.Used and steps_since_spawn >= self.spawn_cooldown:
-            print(f"Detector {self.unique_id} detected agent {Detection.unique_id}!")
-            self.Used = True
-            self.last_spawn_step = current_step
-            # Spawn CUUV at detector location targeting the detected agent
-            self.model.create_agent(type="CUUV", pos=self.spawn, target_agent=Detection)
-        
+    def detected(self, agent, dist, p):
+        """Called by the model sensing pass when a trial succeeds, returns True if we fired"""
+        if self.Used:
+            return False
+        steps_since_spawn = self.model.steps - self.last_spawn_step
+        if steps_since_spawn < self.spawn_cooldown:
+            return False
+        print(f"Detector {self.unique_id} detected agent {agent.unique_id} at {dist:.2f} units (prob: {p:.3f})!")
+        self.Used = True
+        self.model.scheduler.deactivate(self) # a used detector has nothing left to do
+        self.detected_step = self.model.steps
+        self.last_spawn_step = self.model.steps
+        # Spawn CUUV at detector location targeting the detected agent
+        self.model.create_agent(type="CUUV", pos=self.spawn, target_agent=agent)
         # Update plot every step
         #self.update_plot()
-                
-
-
-    def detect(self):
-        """Creates a pop up window"""
-        for agent in self.model.agents:
-            if isinstance(agent, UUVAgent):
-                # Check if agent is still active
-                if not getattr(agent, 'status', True):
-                    continue
-                    
-                dist = np.sqrt((self.position[0] - agent.position[0])**2 + 
-                            (self.position[1] - agent.position[1])**2)
-                
-                if dist <= self.radius:
-                    print(f"UUV {agent.unique_id} is {dist:.2f} units away from detector")
-
-                    # Calculate detection probability
-                    p = self.rayleigh(dist, sigma=10)
-                    self.prob_log.append((dist, p))
-
-                    if np.random.rand() < p:
-                        print(f"Detected with probability: {p:.3f}")
-                        return agent
-                    else:
-                        print(f"Failed to detect (prob: {p:.3f})")
-        
-        return None  # Explicitly return None if no detection
-
-    
+        return True
 
     def rayleigh(self, distance, sigma=10):
+        """Exact detection probability, the sensing pass reads it from a table"""
         return np.exp(-(distance**2) / (2 * sigma**2))
 
     def update_plot(self):
@@ -179,28 +117,5 @@ class DetectorAgent(mesa.Agent):
         plt.pause(0.001)
 
     def cleanup(self):
-        """Remove this agent's canvas items (oval and detection radius)."""
-        try:
-            if hasattr(self, "oval") and self.oval is not None:
-                try:
-                    self.canvas.delete(self.oval)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        try:
-            if hasattr(self, "sprite") and self.sprite is not None:
-                try:
-                    self.canvas.delete(self.sprite)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        try:
-            if hasattr(self, "radius_oval") and self.radius_oval is not None:
-                try:
-                    self.canvas.delete(self.radius_oval)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        """Remove this agent's sprite and detection radius."""
+        self.model.renderer.agent_removed(self)
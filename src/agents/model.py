@@ -16,18 +16,21 @@
 # - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
 # - Prof. Hang Dinh, CIS, Indiana University South Bend
 
-import tkinter as tk
 import numpy as np
 import pandas as pd
 import mesa 
+from scipy.spatial import cKDTree
 
 from . import agent, detector_agent, search_agent, CounterUUVAgent, target_agent
-
-from PIL import Image, ImageTk
-import os
-DUUV_path = os.path.join(os.getcwd(), "resources", "DestroyedEnemyUUV.png")
-DCUUV_path = os.path.join(os.getcwd(), "resources", "DestroyedCUUV.png")
-DTarget_path = os.path.join(os.getcwd(), "resources", "DestroyedTarget.png")
+from renderer import RenderHub, CanvasRenderer
+from pathfinding import FlowField
+from spatial import SpatialIndex, segment_distance
+from recorder import StepRecorder
+from kinematics import Kinematics
+from scheduler import ActiveScheduler
+from timeskip import IdleSkipper
+from sensing import SensingPhase
+from ga_engine import ChromosomeExecutor, encode
 
 class UUVModel(mesa.Model):
     """UUV model testing class"""
@@ -46,6 +49,13 @@ class UUVModel(mesa.Model):
         "attacker" : ("seeker", "GA"),
         "defender" : ('target',"detector", "CUUV",)
     }
+    # order the agent kinds are stepped in, targets are left out as their step does nothing
+    # agents of a class missing from AGENT_MAP are stepped in the "other" phase
+    STEP_PHASES = ("seeker", "GA", "detector", "CUUV", "other")
+    # end conditions a run can stop on, see check_end_conditions
+    END_CONDITIONS = ("targets_destroyed", "attackers_dead")
+    # distance (pixels) under which an attacker hits a target or a CUUV hits an attacker
+    COLLISION_RADIUS = 5
 
     # Genetic Algorithm parameters
     POP_SIZE = 10
@@ -54,16 +64,51 @@ class UUVModel(mesa.Model):
     AGENT_COST=50
     AGENT_CHROMESOME_COMMAND = {'L': 1, 'R': 2, 'U': 3, 'D': 4}
     
-    def __init__(self, spawns, map, canvas, grid, viable_spawn, animator, *args, seed = None, rng = None, **kwargs):
+    def __init__(self, spawns, map=None, canvas=None, grid=None, viable_spawn=None, animator=None, *args, renderer=None, seed = None, rng = None, record_dir=None, end_conditions=(), max_steps=None, event_skip=False, ga_fast=False, pop_size=None, **kwargs):
+        # live/dead/finished counts per AGENT_MAP name, kept up to date by the status hooks
+        # set before super().__init__ so register_agent can always count
+        self.agent_kinds = {agent_class: name for name, agent_class in self.AGENT_MAP.items()}
+        self.reset_counts()
+        self.scheduler = ActiveScheduler(self.STEP_PHASES)
+        # GA agents per spawn group, the class default unless the run sets its own
+        if pop_size is not None:
+            if pop_size < 2:
+                raise ValueError("pop_size needs at least the 2 parents")
+            self.POP_SIZE = int(pop_size)
         super().__init__(*args, seed=seed, rng=rng, **kwargs)
         # setup mesa controls
+        if grid is None:
+            raise ValueError("UUVModel needs a grid to run on")
+
+        # rendering, the model and agents never touch tkinter directly
+        # canvas is kept for the gui, headless runs leave it as None
+        self.canvas = canvas
+        self.renderer = RenderHub()
+        if renderer is not None:
+            self.renderer.subscribe(renderer)
+        if canvas is not None:
+            self.renderer.subscribe(CanvasRenderer(canvas))
 
         # sim stuff gonna get changed
         # self.num_agents = n
-        self.canvas = canvas
         self.spawns = spawns
         self.map = map
         self.grid = grid.grid
+        # water distance to the nearest live target, rebuilt only when the targets change
+        self.target_field = FlowField(self.grid)
+        self.target_field_dirty = True
+        # positions, speeds and waypoints of every mobile agent, moved in one pass per step
+        self.kinematics = Kinematics()
+        # positions of the live agents, rebuilt once a step for collisions and detection
+        self.spatial = SpatialIndex()
+        # every detector senses in one pass per step, trials are drawn from self.rng
+        self.sensing = SensingPhase(self)
+        self.scheduler.set_batch_step("detector", self.sensing.sense)
+        # ga_fast runs every GA agent's whole chromosone in one step instead of a gene per step
+        self.ga_executor = None
+        self.ga_executor_version = None
+        if ga_fast:
+            self.scheduler.set_batch_step("GA", self.execute_ga_agents)
         self.viable_spawns = viable_spawn
         self.animator = animator
 
@@ -101,35 +146,39 @@ class UUVModel(mesa.Model):
         self.current_generation = 0
         self.child_chromosones = list()
         self.create_initial_agent_pop()
-
-        # Data cataloging
-        self.data_collector = mesa.DataCollector(
-            agent_reporters={"Finnished_agent_count": "is_finnished", 
-                             "position": "position",
-                             "Agent type": "Agent_ID",
-                             "is_complete": "is_complete"},
-            model_reporters={"Step": lambda self: self.steps, 
-                             "Total Agents": lambda self: len(self.agents)}   
-        )
+        self.update_spatial_index()
+        self.update_target_snapshot()
+
+        # stopping, the gui runs until stopped so nothing is on by default
+        for condition in end_conditions:
+            if condition not in self.END_CONDITIONS:
+                raise ValueError(f"Unknown end condition {condition}, expected one of {self.END_CONDITIONS}")
+        self.end_conditions = tuple(end_conditions)
+        self.max_steps = max_steps
+        self.end_reason = None
+        # jump over steps where nothing can happen, headless runs only as skipped steps are not drawn or recorded
+        self.skipper = IdleSkipper(self) if event_skip else None
+
+        # Data cataloging, record_dir spills full chunks to disk for long runs
+        self.record_dir = record_dir
+        self.data_collector = StepRecorder(self.AGENT_MAP, spill_dir=record_dir)
 
     def step(self):
-        """advance model by one step"""
-        self.agents.do("step")
+        """advance model by one step, or to the next step where something can happen with event_skip"""
+        self.update_target_snapshot()
+        if self.skipper is not None:
+            self.skipper.skip()
+        self.scheduler.step()
+        self.move_agents()
         self.data_collector.collect(self)
+        self.update_spatial_index()
         self.check_collisions()
 
-        # retrive data from datacollecter
-        raw_agent_data = self.data_collector.get_agent_vars_dataframe()
-        #print("Model Stepping (Debugging)")
-        raw_model_data = self.data_collector.get_model_vars_dataframe()
         finished_count = 0
         if self.ga_model_active is False: # for the GA agents
-            if not raw_agent_data.empty and not raw_model_data.empty:
-                # get agent data
-                current_step = raw_agent_data.index.get_level_values('Step').max() # get the max of the Step
-                is_finnsihed_step = raw_agent_data.xs(current_step, level="Step")['Finnished_agent_count'] # get the cross section of the newest step and Step
-                finished_count = is_finnsihed_step.sum() #return a sum of how many agents have finnished
-                print(f"Finished agents at step {current_step}: {finished_count}")
+            finished_count = self.counts["GA"]["finished"] # how many agents have finnished
+            if len(self.agents) > 0:
+                print(f"Finished agents at step {self.steps}: {finished_count}")
         
             if finished_count == len(self.agents):
                 # add the losers to a kill list to remove later
@@ -138,13 +187,10 @@ class UUVModel(mesa.Model):
                 self.score_ga_agents()
                 self.create_next_generation(agent_type="GA")
         else: # for the GA model
-            if not raw_agent_data.empty and not raw_model_data.empty:
-                # get agent data
-                current_step = raw_agent_data.index.get_level_values('Step').max() # get the max of the Step
-                is_finnsihed_step = raw_agent_data.xs(current_step, level="Step")['is_complete'] # get the cross section of the newest step and Step
-                if is_finnsihed_step.sum() >= 1:
+            if len(self.agents) > 0:
+                if self.counts["seeker"]["finished"] >= 1:
                     finished_count = 1
-                print(f"Finished agents at step {current_step}: {finished_count}")
+                print(f"Finished agents at step {self.steps}: {finished_count}")
         
             if finished_count == 1:
                 # add the losers to a kill list to remove later
@@ -153,6 +199,117 @@ class UUVModel(mesa.Model):
                 self.reset_sim() 
                 self.create_next_model_generation()  
 
+        self.check_end_conditions()
+
+    def move_agents(self):
+        """Advance every mobile agent at once, then let the renderers catch up"""
+        moved = self.kinematics.advance()
+        if self.renderer.active:
+            for slot in moved.tolist():
+                agent = self.kinematics.agents[slot]
+                if agent is not None:
+                    self.renderer.agent_moved(agent)
+
+    def reset_counts(self):
+        """Zero the live/dead/finished counters"""
+        self.counts = {
+            name: {"live": 0, "dead": 0, "finished": 0}
+            for name in self.AGENT_MAP
+        }
+        self.dead_ids = set()
+        self.finished_ids = set()
+
+    def register_agent(self, agent):
+        """Called by mesa for every new agent, counts it as live"""
+        super().register_agent(agent)
+        kind = self.agent_kinds.get(type(agent))
+        self.scheduler.add(kind if kind is not None else "other", agent)
+        if kind is not None:
+            self.counts[kind]["live"] += 1
+
+    def deregister_agent(self, agent):
+        """Called by mesa when an agent is removed"""
+        super().deregister_agent(agent)
+        self.scheduler.remove(agent)
+        slot = getattr(agent, "slot", None)
+        if slot is not None:
+            self.kinematics.release(slot)
+        kind = self.agent_kinds.get(type(agent))
+        if kind is None:
+            return
+        if agent.unique_id in self.dead_ids:
+            self.dead_ids.discard(agent.unique_id)
+            self.counts[kind]["dead"] -= 1
+        else:
+            self.counts[kind]["live"] -= 1
+        if agent.unique_id in self.finished_ids:
+            self.finished_ids.discard(agent.unique_id)
+            self.counts[kind]["finished"] -= 1
+
+    def agent_destroyed(self, agent):
+        """Mark an agent destroyed (status False) and update the counters"""
+        agent.status = False
+        self.scheduler.deactivate(agent)
+        if getattr(agent, "slot", None) is not None:
+            self.kinematics.set_moving(agent.slot, False)
+        kind = self.agent_kinds.get(type(agent))
+        if kind is None or agent.unique_id in self.dead_ids:
+            return
+        self.dead_ids.add(agent.unique_id)
+        self.counts[kind]["live"] -= 1
+        self.counts[kind]["dead"] += 1
+        if agent.unique_id in self.finished_ids:
+            self.finished_ids.discard(agent.unique_id)
+            self.counts[kind]["finished"] -= 1
+        if kind == "target":
+            self.target_field_dirty = True
+
+    def agent_restored(self, agent):
+        """Undo agent_destroyed, used when an agent is reset"""
+        agent.status = True
+        self.scheduler.activate(agent)
+        if getattr(agent, "slot", None) is not None:
+            self.kinematics.set_moving(agent.slot, True)
+        kind = self.agent_kinds.get(type(agent))
+        if kind is None or agent.unique_id not in self.dead_ids:
+            return
+        self.dead_ids.discard(agent.unique_id)
+        self.counts[kind]["dead"] -= 1
+        self.counts[kind]["live"] += 1
+        if kind == "target":
+            self.target_field_dirty = True
+
+    def agent_finished(self, agent):
+        """Count a live agent as finished (seeker complete or GA agent out of moves)"""
+        kind = self.agent_kinds.get(type(agent))
+        # nothing left to do until a new target shows up, see create_agent
+        self.scheduler.deactivate(agent)
+        if kind is None or agent.unique_id in self.finished_ids or agent.unique_id in self.dead_ids:
+            return
+        self.finished_ids.add(agent.unique_id)
+        self.counts[kind]["finished"] += 1
+
+    def category_count(self, category, key="live"):
+        """Sum of one counter over an AGENT_CATEGORIES entry ie ("attacker", "dead")"""
+        return sum(self.counts[name][key] for name in self.AGENT_CATEGORIES.get(category, ()) if name in self.counts)
+
+    def check_end_conditions(self):
+        """Stop the model (running = False) once the outcome is decided"""
+        reason = None
+        if "targets_destroyed" in self.end_conditions:
+            target = self.counts["target"]
+            if target["dead"] > 0 and target["live"] == 0:
+                reason = "targets_destroyed"
+        if reason is None and "attackers_dead" in self.end_conditions:
+            if self.category_count("attacker", "dead") > 0 and self.category_count("attacker", "live") == 0:
+                reason = "attackers_dead"
+        if reason is None and self.max_steps is not None and self.steps >= self.max_steps:
+            reason = "step_cap"
+        if reason is not None:
+            print(f"Run ended at step {self.steps}: {reason}")
+            self.end_reason = reason
+            self.running = False
+
     def agent_registration(self, agent_instance, pos, type_name):
         '''Inital Agent registration'''
         # increase population for that agent type
@@ -218,129 +375,160 @@ class UUVModel(mesa.Model):
             "model": self,
             "spawn": spawn_pos,  # Fixed: was "n" : 1 which is wrong
             "map": self.map, 
-            "canvas": self.canvas,
             "grid": self.grid,     
         }
         final_kwargs = {**agent_kwargs, **extra_params}
 
         # CREATE THE AGENT DIRECTLY (not via create_agents)
         agent_instance = AgentClass(**final_kwargs)
+        if agent_type == "target":
+            self.target_field_dirty = True
+            # finished seekers have something to chase again
+            for seeker in self.agents_by_type.get(self.AGENT_MAP["seeker"], []):
+                if seeker.status and seeker.is_complete:
+                    self.scheduler.activate(seeker)
         return agent_instance
     
+    def update_target_snapshot(self):
+        """
+        Publish the live targets once per step as read only arrays:
+        target_positions (T, 2) pixels, target_cells (T, 2) (row, col) and
+        target_agents in the same order. Nearest target assignments are redone
+        lazily the first time a seeker asks this step.
+        """
+        target_class = self.AGENT_MAP.get("target")
+        self.target_agents = [
+            agent for agent in self.agents_by_type.get(target_class, [])
+            if getattr(agent, 'position', None) is not None and getattr(agent, 'status', True)
+        ]
+        positions = np.array([[t.position[0], t.position[1]] for t in self.target_agents], dtype=float).reshape(-1, 2)
+        cells = np.array([[t.spawn[1], t.spawn[0]] for t in self.target_agents], dtype=int).reshape(-1, 2)
+        positions.flags.writeable = False
+        cells.flags.writeable = False
+        self.target_positions = positions
+        self.target_cells = cells
+        self.nearest_targets = None  # seeker unique_id -> index into the snapshot
+
     def get_target_positions(self):
         """
         Return list of current target agent positions.
-        Used by seeker agents to find targets dynamically.
+        Comes from this step's snapshot, see update_target_snapshot.
         """
-        #print("=== GET_TARGET_POSITIONS CALLED ===")
-        
-        target_class = self.AGENT_MAP.get("target")
-        if not target_class:
-            print("ERROR: No target class in AGENT_MAP")
-            print(f"AGENT_MAP keys: {list(self.AGENT_MAP.keys())}")
-            return []
-        
-        #print(f"Target class found: {target_class}")
-        
-        target_agents = self.agents_by_type.get(target_class, [])
-        #print(f"Number of target agents: {len(target_agents)}")
-        
-        positions = []
-        
-        for agent in target_agents:
-            #print(f"Checking target agent {agent.unique_id}:")
-            #print(f"  - Has position: {hasattr(agent, 'position')}")
-            #print(f"  - Position value: {getattr(agent, 'position', 'NO POSITION ATTR')}")
-            #print(f"  - Has status: {hasattr(agent, 'status')}")
-            #print(f"  - Status value: {getattr(agent, 'status', 'NO STATUS ATTR')}")
-            
-            # Check if status is True (alive)
-            if hasattr(agent, 'position') and getattr(agent, 'status', True):
-                positions.append(agent.position)
-                #print(f"  -> ADDED to positions list")
+        return list(self.target_positions)
+
+    def assign_nearest_targets(self):
+        """Nearest snapshot target for every live seeker in one tree query"""
+        seeker_class = self.AGENT_MAP.get("seeker")
+        seekers = [a for a in self.agents_by_type.get(seeker_class, []) if a.status]
+        self.nearest_targets = dict()
+        if not seekers or len(self.target_positions) == 0:
+            return
+        points = np.array([[a.position[0], a.position[1]] for a in seekers], dtype=float)
+        _, index = cKDTree(self.target_positions).query(points, k=1)
+        self.nearest_targets = dict(zip((a.unique_id for a in seekers), index.tolist()))
+
+    def nearest_target(self, agent):
+        """Snapshot index of the target closest to a seeker in a straight line, None if there is none"""
+        if self.nearest_targets is None:
+            self.assign_nearest_targets()
+        return self.nearest_targets.get(agent.unique_id)
+
+    def get_target_field(self):
+        """
+        FlowField toward the live targets, None if no target is left.
+        Only rebuilt after a target is added or destroyed.
+        """
+        if self.target_field_dirty or self.target_field.is_stale():
+            target_class = self.AGENT_MAP.get("target")
+            cells = [
+                (agent.spawn[1], agent.spawn[0])
+                for agent in self.agents_by_type.get(target_class, [])
+                if getattr(agent, 'status', True)
+            ]
+            self.target_field.build(cells)
+            self.target_field_dirty = False
+        if self.counts["target"]["live"] == 0:
+            return None
+        return self.target_field
+
+    def get_ga_executor(self):
+        """ChromosomeExecutor over the current water mask, rebuilt if the grid changed"""
+        if self.ga_executor is None or self.ga_executor_version != self.grid.version:
+            self.ga_executor = ChromosomeExecutor(self.grid.water)
+            self.ga_executor_version = self.grid.version
+        return self.ga_executor
+
+    def execute_ga_agents(self, agents):
+        """
+        GA batch step for ga_fast. Runs the genes each agent has left in one
+        go and finishes them all, in the order stepping them would have, so
+        the 5 genes added on finishing draw from the rng in the same order.
+        """
+        pending = [a for a in agents if not a.is_finnished]
+        if not pending:
+            return
+        # an agent that already failed only has its finishing step left
+        runs = [a for a in pending if not a.is_failed]
+        genes, lengths = encode([a.chromosone[a.next_command_num:] for a in runs])
+        result = self.get_ga_executor().run(
+            [a.grid_index for a in runs], genes, lengths, [a.target_index for a in runs]
+        )
+        outcome = {a.unique_id: i for i, a in enumerate(runs)}
+        finish_step = [int(result.finish_steps[outcome[a.unique_id]]) if a.unique_id in outcome else 1 for a in pending]
+
+        for n in sorted(range(len(pending)), key=lambda n: (finish_step[n], n)):
+            agent = pending[n]
+            i = outcome.get(agent.unique_id)
+            if i is None:
+                agent.finish()
             else:
-                ...
-                #print(f"  -> SKIPPED (dead or no position)")
-        
-        #print(f"Total positions returned: {len(positions)}")
-        #print(f"Positions: {positions}")
-        #print(f"=== END GET_TARGET_POSITIONS ===\n")
-        
-        return positions
+                agent.finish_run(result.final[i], bool(result.failed[i]), result.used[i])
+
+    def update_spatial_index(self):
+        """Snapshot the live agent positions into the spatial index"""
+        groups = dict()
+        for name, agent_class in self.AGENT_MAP.items():
+            groups[name] = [
+                a for a in self.agents_by_type.get(agent_class, [])
+                if getattr(a, 'status', True) and getattr(a, 'position', None) is not None
+            ]
+        self.spatial.rebuild(groups, step=self.steps)
 
     def check_collisions(self):
         """
         Check collisions for:
         1. Attackers reaching targets (sets target.status = False)
         2. CUUVs reaching attacker agents (sets attacker.status = False)
+        Both are swept over the step's movement so fast agents can't pass through each other.
         """
-        import numpy as np
-        
         target_class = self.AGENT_MAP.get("target")
         cuuv_class = self.AGENT_MAP.get("CUUV")
         
-        attacker_classes = [
-            self.AGENT_MAP[t] for t in self.AGENT_CATEGORIES.get("attacker", [])
-            if t in self.AGENT_MAP
-        ]
-        
         # 1. Check attacker -> target collisions
         if target_class:
-            target_agents = list(self.agents_by_type.get(target_class, []))
-            
-            for target_agent in target_agents:
-                # Skip if already destroyed
-                if not getattr(target_agent, 'status', False):
-                    continue
-                    
-                for attacker_agent in self.agents:
-                    if type(attacker_agent) not in attacker_classes:
-                        continue
-                    
-                    # Skip if attacker is dead
-                    if not getattr(attacker_agent, 'status', False):
-                        continue
-                    
-                    if not hasattr(attacker_agent, 'position') or not hasattr(target_agent, 'position'):
-                        continue
-                        
-                    try:
-                        dist = np.linalg.norm(
-                            np.array(attacker_agent.position) - 
-                            np.array(target_agent.position)
-                        )
-                        
-                        if dist < 5:  # collision threshold (pixels)
-                            print(f"Target {target_agent.unique_id} destroyed by attacker {attacker_agent.unique_id}!")
-                            target_agent.status = False  # Mark as destroyed
-                            #Update the target visuals to show death
-                            try:
-                                target_agent.canvas.itemconfig(target_agent.oval, fill='orange', outline='black', width=2)
-                            except Exception:
-                                pass
-                            #Above for oval, below for sprite
-
-
-                            DTarget = Image.open(DTarget_path).resize((20, 20))
-                            new_DTarget = ImageTk.PhotoImage(DTarget)
-                            target_agent.icon = new_DTarget  # Prevent garbage collection
-                            self.DTargetimage = new_DTarget
-
-                            try:
-                                target_agent.canvas.itemconfig(target_agent.sprite, image=self.DTargetimage) 
-                            except Exception:
-                                pass
-
-
-                             
-                    except Exception as e:
-                        print(f"Collision check error: {e}")
+            target_agents = [t for t in self.spatial.agents.get("target", []) if t.status]
+            if target_agents:
+                # every target against the path each attacker moved along this step
+                hits = self.spatial.query_swept_many(
+                    self.AGENT_CATEGORIES.get("attacker", ()),
+                    [t.position for t in target_agents],
+                    self.COLLISION_RADIUS, strict=True
+                )
+                for target_agent, found in zip(target_agents, hits):
+                    for attacker_agent, dist in found:
+                        # Skip if attacker is dead
+                        if not getattr(attacker_agent, 'status', False):
+                            continue
+                        print(f"Target {target_agent.unique_id} destroyed by attacker {attacker_agent.unique_id}!")
+                        self.agent_destroyed(target_agent)  # Mark as destroyed
+                        #Update the target visuals to show death
+                        self.renderer.agent_changed(target_agent, "destroyed")
+                        break
         
         # 2. Check CUUV -> attacker collisions
         if cuuv_class:
-            cuuv_agents = list(self.agents_by_type.get(cuuv_class, []))
-            
-            for cuuv_agent in cuuv_agents:
+            chases = list()
+            for cuuv_agent in self.agents_by_type.get(cuuv_class, []):
                 target_agent = getattr(cuuv_agent, 'target', None)
                 
                 if target_agent is None or not hasattr(target_agent, 'position'):
@@ -350,60 +538,31 @@ class UUVModel(mesa.Model):
                 if not getattr(target_agent, 'status', False):
                     cuuv_agent.target = None  # Clear CUUV's target
                     continue
-                
-                if not hasattr(cuuv_agent, 'position'):
-                    continue
-                
-                try:
-                    dist = np.linalg.norm(
-                        np.array(cuuv_agent.position) - 
-                        np.array(target_agent.position)
-                    )
-                    
-                    if dist < 5:  # CUUV collision threshold (tighter)
+                chases.append((cuuv_agent, target_agent))
+
+            if chases:
+                # closest approach over the step with the attacker held still, both may have moved
+                starts = [np.subtract(SpatialIndex.prev_position(c), SpatialIndex.prev_position(t)) for c, t in chases]
+                ends = [np.subtract(c.position[:2], t.position[:2]) for c, t in chases]
+                dists = segment_distance(starts, ends, np.zeros((len(chases), 2)))
+
+                for (cuuv_agent, target_agent), dist in zip(chases, dists.tolist()):
+                    # an earlier CUUV this step may have got it already
+                    if not getattr(target_agent, 'status', False):
+                        cuuv_agent.target = None
+                        continue
+                    if dist < self.COLLISION_RADIUS:
                         print(f"CUUV {cuuv_agent.unique_id} neutralized attacker {target_agent.unique_id}!")
                         
                         # Kill the attacker
-                        target_agent.status = False
-                        
-                        # Visual feedback for attacker
-                        try:
-                            target_agent.canvas.itemconfig(target_agent.oval, fill="#7C0000")
-                        except Exception:
-                            pass
+                        self.agent_destroyed(target_agent)
                         
-                        try:
-                            cuuv_agent.canvas.itemconfig(cuuv_agent.oval, fill="#004075")
-                        except Exception:
-                            pass
-                            #above for oval, below for sprite
-
-                        DUUV = Image.open(DUUV_path).resize((20, 20))
-                        new_DUUV = ImageTk.PhotoImage(DUUV)
-                        self.DUUVimage = new_DUUV  # Prevent garbage collection
-                        target_agent.icon = new_DUUV  
-
-                        DCUUV = Image.open(DCUUV_path).resize((20, 20))
-                        new_DCUUV = ImageTk.PhotoImage(DCUUV)
-                        cuuv_agent.icon = new_DCUUV  # Prevent garbage collection
-                        self.DCUUVimage = new_DCUUV   
-
-                        try:
-                            target_agent.canvas.itemconfig(target_agent.sprite, image=self.DUUVimage)
-                        except Exception:
-                            pass
-                        
-                        try:
-                            cuuv_agent.canvas.itemconfig(cuuv_agent.sprite, image=self.DCUUVimage)
-                        except Exception:
-                            pass
-
+                        # Visual feedback for attacker and CUUV
+                        self.renderer.agent_changed(target_agent, "destroyed")
+                        self.renderer.agent_changed(cuuv_agent, "destroyed")
                         
                         # Clear CUUV's target
                         cuuv_agent.target = None
-                        
-                except Exception as e:
-                    print(f"CUUV collision check error: {e}")
             
     def create_initial_agent_pop(self):
          """Create the intial populations for the model use only once"""
@@ -596,18 +755,15 @@ class UUVModel(mesa.Model):
 
     def reset_sim(self):
         """Reset the simulation"""
-        self.animator.on_start_click()
+        if self.animator is not None:
+            self.animator.on_start_click()
         self.clear_agents()
         self.create_initial_agent_pop()
-        self.data_collector = mesa.DataCollector(
-            agent_reporters={"Finnished_agent_count": "is_finnished", 
-                             "position": "position",
-                             "Agent type": "Agent_ID",
-                             "is_complete": "is_complete"},
-            model_reporters={"Step": lambda self: self.steps, 
-                             "Total Agents": lambda self: len(self.agents)}   
-        )
-        self.animator.on_start_click()
+        self.update_spatial_index()
+        self.update_target_snapshot()
+        self.data_collector = StepRecorder(self.AGENT_MAP, spill_dir=self.record_dir)
+        if self.animator is not None:
+            self.animator.on_start_click()
 
     def clear_agents(self):
         #This methods first gathers references to each agent, and calls the cleanup method on each agent. 
@@ -636,12 +792,6 @@ class UUVModel(mesa.Model):
                             a.cleanup()
                         except Exception:
                             pass
-                    # remove agent's canvas oval if stored on the agent and model has a canvas
-                    if hasattr(a, "oval") and hasattr(self, "canvas") and self.canvas is not None:
-                        try:
-                            self.canvas.delete(a.oval)
-                        except Exception:
-                            pass
                 except Exception:
                     pass
         except Exception:
@@ -699,7 +849,12 @@ class UUVModel(mesa.Model):
         except Exception:
             pass
 
-        # 4) Clear data collector
+        # 4) Reset the live counters and kinematics, the agents were cleared without deregistering
+        self.reset_counts()
+        self.kinematics.clear()
+        self.scheduler.clear()
+
+        # 5) Clear data collector
         try:
             if hasattr(self, "data_collector"):
                 self.data_collector = None
@@ -16,7 +16,8 @@
 # - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
 # - Prof. Hang Dinh, CIS, Indiana University South Bend
 
-import tkinter as tk
+import logging
+
 import numpy as np
 import heapq
 import pandas as pd
@@ -28,19 +29,22 @@ from shapely.geometry import Point, shape
 from cell import Cell
 from . import model
 
+# failed moves happen every generation, they are only worth seeing when debugging
+log = logging.getLogger(__name__)
+
 
 class SearchAgent(mesa.Agent):
     '''Search Agent for GA'''
+    RENDER_TAG = "search"
     # keep in mind that the spawns pos(x,y) are flipped
-    def __init__(self,model, spawn, map, canvas, grid, group_id, generation, chromosone, *args, **kwargs):
+    def __init__(self,model, spawn, map, grid, group_id, generation, chromosone, *args, **kwargs):
         super().__init__(model, *args, **kwargs)
         # Target and spawn
         
         self.spawn = spawn
         self.pos_pixel = [grid[spawn[1]][spawn[0]].pos_x, grid[spawn[1]][spawn[0]].pos_y] #[x,y] for canvas
         self.grid_index = [spawn[1], spawn[0]]
-        self.grid = np.array(grid)
-        self.ROW, self.COL = self.grid.shape
+        self.ROW, self.COL = grid.shape
         self.grid = grid
         self.target_index = [0, 0]
 
@@ -68,11 +72,10 @@ class SearchAgent(mesa.Agent):
         self.gui_color = 'red'
         self.tag = 'search'
 
-        # tkinter gui
+        # gui, drawing is done by the model renderer
         self.map = map
-        self.canvas = canvas
-        self.oval = self.canvas.create_oval(self.pos_pixel[0]-5,self.pos_pixel[1]-5, self.pos_pixel[0]+5, self.pos_pixel[1]+5, fill=self.gui_color, tags=self.tag)
-        self.canvas.lift(self.oval)
+        self.color = self.gui_color
+        self.model.renderer.agent_added(self)
         
 
     def step(self):
@@ -85,18 +88,40 @@ class SearchAgent(mesa.Agent):
                     self.get_next_pos(next_command)
                     self.update_icon_pos()              
                 else:
-                    self.is_finnished = True
-                    self.canvas.itemconfig(self.oval, fill="black")
-                    self.chromosone = self.chromosone + self.create_chromosone(5) #add 5 new random moves
-                    self.commands = iter(self.chromosone)
-                    self.next_command_num = 0
+                    self.finish()
                     return
             # print(f'pix pos: {self.pos_pixel}')
             # print(f'grid pos: {self.grid_index}')
             # print(f'failed: {self.is_failed}')
             # print(f'manhatten: {self.calculate_fitness()}')
         else:
-            self.is_finnished = True
+            if not self.is_finnished:
+                self.finish()
+
+    def finish(self):
+        """Out of moves (or failed), wait for the rest of the generation"""
+        self.is_finnished = True
+        self.model.agent_finished(self)
+        if self.is_failed:
+            return
+        self.model.renderer.agent_changed(self, "finished")
+        self.chromosone = self.chromosone + self.create_chromosone(5) #add 5 new random moves
+        self.commands = iter(self.chromosone)
+        self.next_command_num = 0
+
+    def finish_run(self, grid_index, failed, used):
+        """
+        Jump to where stepping the rest of the chromosone would leave us,
+        from a ChromosomeExecutor run over the genes we had left.
+        """
+        self.next_command_num += int(used)
+        self.grid_index = [int(grid_index[0]), int(grid_index[1])]
+        self.pos_pixel = [self.grid[self.grid_index[0]][self.grid_index[1]].pos_x, self.grid[self.grid_index[0]][self.grid_index[1]].pos_y]
+        self.update_icon_pos()
+        if failed:
+            self.is_failed = True
+            self.commands = iter(self.chromosone[self.next_command_num:])
+        self.finish()
        
     def get_next_pos(self, command):
         '''Return the next position and if valid'''
@@ -106,60 +131,55 @@ class SearchAgent(mesa.Agent):
                     if self.is_unblocked(self.grid_index[0]-1, self.grid_index[1]): # check if land
                         self.grid_index = [self.grid_index[0]-1, self.grid_index[1]]
                         self.pos_pixel = [self.grid[self.grid_index[0]][self.grid_index[1]].pos_x, self.grid[self.grid_index[0]][self.grid_index[1]].pos_y]
-                        self.canvas.move(self.oval, self.pos_pixel[0], self.pos_pixel[1]) 
                     else:
-                        print('hit land')
+                        log.debug('hit land')
                         self.is_failed = True
                 else:
-                    print('out of bounds')
+                    log.debug('out of bounds')
                     self.is_failed = True
             case 'R':
                 if self.is_valid(self.grid_index[0]+1, self.grid_index[1]):# check if in bounds
                     if self.is_unblocked(self.grid_index[0]+1, self.grid_index[1]): # check if land
                         self.grid_index = [self.grid_index[0]+1, self.grid_index[1]]
                         self.pos_pixel = [self.grid[self.grid_index[0]][self.grid_index[1]].pos_x, self.grid[self.grid_index[0]][self.grid_index[1]].pos_y]
-                        self.canvas.move(self.oval, self.pos_pixel[0], self.pos_pixel[1]) 
                     else:
-                        print('hit land')
+                        log.debug('hit land')
                         self.is_failed = True
                 else:
-                    print('out of bounds')
+                    log.debug('out of bounds')
                     self.is_failed = True
             case 'U':
                 if self.is_valid(self.grid_index[0], self.grid_index[1]-1):# check if in bounds
                     if self.is_unblocked(self.grid_index[0], self.grid_index[1]-1): # check if land
                         self.grid_index = [self.grid_index[0], self.grid_index[1]-1]
                         self.pos_pixel = [self.grid[self.grid_index[0]][self.grid_index[1]].pos_x, self.grid[self.grid_index[0]][self.grid_index[1]].pos_y]
-                        self.canvas.move(self.oval, self.pos_pixel[0], self.pos_pixel[1]) 
                     else:
-                        print('hit land')
+                        log.debug('hit land')
                         self.is_failed = True
                 else:
-                    print('out of bounds')
+                    log.debug('out of bounds')
                     self.is_failed = True
             case 'D':
                 if self.is_valid(self.grid_index[0], self.grid_index[1]+1):# check if in bounds
                     if self.is_unblocked(self.grid_index[0], self.grid_index[1]+1): # check if 
                         self.grid_index = [self.grid_index[0], self.grid_index[1]+1]
                         self.pos_pixel = [self.grid[self.grid_index[0]][self.grid_index[1]].pos_x, self.grid[self.grid_index[0]][self.grid_index[1]].pos_y]
-
-                        self.canvas.move(self.oval, self.pos_pixel[0], self.pos_pixel[1]) 
                     else:
-                        print('hit land')
+                        log.debug('hit land')
                         self.is_failed = True
                 else:
-                    print('out of bounds')
+                    log.debug('out of bounds')
                     self.is_failed = True 
             case _:
-                print(f"Unknow command : {command}")
+                log.warning("Unknow command : %s", command)
 
     def is_valid(self, row, col):
         """Check if a cell is valid"""
         return (row >= 0) and (row < self.ROW) and (col >= 0) and (col < self.COL)
 
     def is_unblocked(self, row, col):
-        """Check if cell is: 1 is land, 0 is water"""
-        return self.grid[row][col].id != 1
+        """Check if cell is water in the grid mask"""
+        return self.grid.water[row, col] == 1
 
     def is_destination(self, row, col):
         """Check if cell is the destination"""
@@ -167,13 +187,7 @@ class SearchAgent(mesa.Agent):
     
     def update_icon_pos(self):
         '''update the coords of the icon on the canvas'''
-        center_x = self.pos_pixel[0]
-        center_y = self.pos_pixel[1]
-        x1=center_x-5
-        y1=center_y-5
-        x2=center_x+5
-        y2=center_y+5
-        self.canvas.coords(self.oval, x1, y1, x2, y2) 
+        self.model.renderer.agent_moved(self)
 
     def mutate_genes(self, chromosone):
         """Mutate the genes of the child"""
@@ -230,17 +244,10 @@ class SearchAgent(mesa.Agent):
     def kill_your_self_now(self):
         """Will kill the agent NOW, it serves zero purpose. kys"""
         # remove itself from the screen
-        self.canvas.delete(self.oval)
+        self.model.renderer.agent_removed(self)
         # kill the agent in model
         self.remove()
         
     def cleanup(self):
-        """Remove this agent's canvas items (oval)."""
-        try:
-            if hasattr(self, "oval") and self.oval is not None:
-                try:
-                    self.canvas.delete(self.oval)
-                except Exception:
-                    pass
-        except Exception:
-            pass
\ No newline at end of file
+        """Remove this agent's oval."""
+        self.model.renderer.agent_removed(self)
@@ -0,0 +1,228 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+"""
+Headless batch runner for saved spawn configs.
+
+Run from the src folder (or with src on the PYTHONPATH):
+    python -m batch ../configs/Demo.json ../configs/test.json
+        --shape ../data/shape_files/zipfolder/Harbour_Depth_Area.shp
+        --cells 50 --steps 500 --seeds 1 2 3 --out ../runs
+
+Every (config, seed) pair writes a summary.json and a trajectory.csv to
+<out>/<config name>/seed_<seed>/ and one row to <out>/runs.csv.
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import time
+from pathlib import Path
+
+
+from agents.model import UUVModel
+from config import ConfigManager
+from grid import Grid
+from map import MapControl
+from map_cache import MapCache
+
+CANVAS_SIZE = (700, 700)
+TRAJECTORY_FIELDS = ["step", "agent_id", "agent_type", "x", "y", "status"]
+
+
+def build_world(shape_path, cells_n, use_cache=True):
+    """Load the map and build the grid without a canvas"""
+    cache = MapCache() if use_cache else None
+    world_map = MapControl(canvas=None, shape_path=shape_path, cache=cache)
+    grid = Grid(width=CANVAS_SIZE[0], height=CANVAS_SIZE[1], cells_n=cells_n, map=world_map)
+    return world_map, grid
+
+
+def grid_validator(grid):
+    """Return a validate_fn for ConfigManager.load that rejects spawns off the grid or on land"""
+    rows = len(grid.grid)
+    cols = len(grid.grid[0]) if rows > 0 else 0
+
+    def _validator(entry):
+        x, y = entry["pos"]
+        if x < 0 or x >= cols or y < 0 or y >= rows:
+            return False, f"Position out of bounds: ({x},{y})"
+        if grid.grid[y][x].id == 1:
+            return False, f"Cell at ({x},{y}) is blocked"
+        return True, None
+    return _validator
+
+
+def load_spawns(config_path, grid):
+    """Load a saved config, returns (spawns, warnings)"""
+    manager = ConfigManager(create_dir=False)
+    spawns, warnings, _ = manager.load(config_path, validate_fn=grid_validator(grid))
+    return spawns, warnings
+
+
+def agent_type_names():
+    """Agent class -> AGENT_MAP name"""
+    return {agent_class: name for name, agent_class in UUVModel.AGENT_MAP.items()}
+
+
+def record_positions(model, step, rows, type_names):
+    """Append the position of every agent at this step"""
+    for a in model.agents:
+        position = getattr(a, "position", None)
+        if position is None:
+            position = getattr(a, "pos_pixel", None)
+        if position is None:
+            continue
+        rows.append([step, a.unique_id, type_names.get(type(a), type(a).__name__),
+                     float(position[0]), float(position[1]), getattr(a, "status", True)])
+
+
+def summarize_run(model):
+    """Outcome of one finished run"""
+    target_class = model.AGENT_MAP["target"]
+    detector_class = model.AGENT_MAP["detector"]
+    attacker_classes = tuple(model.AGENT_MAP[t] for t in model.AGENT_CATEGORIES["attacker"])
+
+    targets = list(model.agents_by_type.get(target_class, []))
+    detectors = list(model.agents_by_type.get(detector_class, []))
+    attackers = [a for a in model.agents if isinstance(a, attacker_classes)]
+    detect_steps = [d.detected_step for d in detectors if d.detected_step is not None]
+
+    return {
+        "steps": model.steps,
+        "targets": len(targets),
+        "targets_destroyed": sum(1 for t in targets if not t.status),
+        "attackers": len(attackers),
+        "attackers_neutralized": sum(1 for a in attackers if not getattr(a, "status", True)),
+        "detections": len(detect_steps),
+        "first_detection_step": min(detect_steps) if detect_steps else None,
+    }
+
+
+def run_scenario(spawns, world, max_steps, seed=None, record_trajectories=True,
+                 end_conditions=UUVModel.END_CONDITIONS, event_skip=False, ga_fast=False,
+                 pop_size=None):
+    """
+    Run one headless model, returns (summary, trajectory_rows)
+    world is the (map, grid) pair from build_world
+    the run stops at max_steps or as soon as one of end_conditions is met
+    event_skip jumps over idle steps, their trajectory rows are left out
+    ga_fast runs each GA generation in a single step
+    pop_size overrides the GA agents per spawn group
+    """
+    world_map, grid = world
+    model = UUVModel(spawns=spawns, map=world_map, grid=grid, seed=seed,
+                     end_conditions=end_conditions, max_steps=max_steps, event_skip=event_skip, ga_fast=ga_fast,
+                     pop_size=pop_size)
+    type_names = agent_type_names()
+    rows = list()
+
+    start = time.perf_counter()
+    if record_trajectories:
+        record_positions(model, 0, rows, type_names)
+    while model.running:
+        model.step()
+        if record_trajectories:
+            record_positions(model, model.steps, rows, type_names)
+
+    summary = summarize_run(model)
+    summary["end_reason"] = model.end_reason
+    summary["skipped_steps"] = model.skipper.skipped if model.skipper is not None else 0
+    summary["seed"] = seed
+    summary["wall_time_s"] = round(time.perf_counter() - start, 4)
+    return summary, rows
+
+
+def write_run(run_dir, summary, rows):
+    """Write the summary and trajectory of one run"""
+    run_dir.mkdir(parents=True, exist_ok=True)
+    with open(run_dir / "summary.json", "w", encoding="utf-8") as fh:
+        json.dump(summary, fh, indent=2)
+    with open(run_dir / "trajectory.csv", "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(TRAJECTORY_FIELDS)
+        writer.writerows(rows)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run saved spawn configs headless")
+    parser.add_argument("configs", nargs="+", help="config json files saved by the GUI")
+    parser.add_argument("--shape", required=True, help="shapefile of the map")
+    parser.add_argument("--cells", type=int, default=50, help="grid cells per side")
+    parser.add_argument("--steps", type=int, default=500, help="max model steps per run")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0], help="seeds to run each config with")
+    parser.add_argument("--out", default="runs", help="output folder")
+    parser.add_argument("--end-on", nargs="*", choices=UUVModel.END_CONDITIONS,
+                        default=list(UUVModel.END_CONDITIONS),
+                        help="stop a run early when these happen, pass nothing to always run --steps")
+    parser.add_argument("--event-skip", action="store_true",
+                        help="jump over steps where nothing can be detected or hit")
+    parser.add_argument("--fast-ga", action="store_true",
+                        help="run every GA agent's chromosone in one step instead of a gene per step")
+    parser.add_argument("--pop-size", type=int, default=None,
+                        help="GA agents per spawn group, defaults to UUVModel.POP_SIZE")
+    parser.add_argument("--no-trajectories", action="store_true", help="only write the summaries")
+    parser.add_argument("--verbose", action="store_true", help="show the model prints")
+    parser.add_argument("--no-cache", action="store_true", help="always parse the shapefile, skip the map cache")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"Building map {args.shape} with {args.cells} cells")
+    world = build_world(args.shape, args.cells, use_cache=not args.no_cache)
+
+    index_rows = list()
+    for config_path in args.configs:
+        spawns, warnings = load_spawns(config_path, world[1])
+        for w in warnings:
+            print(f"{config_path}: {w}")
+        name = Path(config_path).stem
+
+        for seed in args.seeds:
+            # the model prints a lot every step, hide it unless asked
+            with contextlib.ExitStack() as stack:
+                if not args.verbose:
+                    devnull = stack.enter_context(open(os.devnull, "w"))
+                    stack.enter_context(contextlib.redirect_stdout(devnull))
+                summary, rows = run_scenario(spawns, world, args.steps, seed=seed,
+                                             record_trajectories=not args.no_trajectories,
+                                             end_conditions=args.end_on,
+                                             event_skip=args.event_skip, ga_fast=args.fast_ga,
+                                             pop_size=args.pop_size)
+            summary["config"] = str(config_path)
+            write_run(out_dir / name / f"seed_{seed}", summary, rows)
+            index_rows.append(summary)
+            print(f"{name} seed {seed}: {summary['targets_destroyed']}/{summary['targets']} targets destroyed, "
+                  f"{summary['attackers_neutralized']}/{summary['attackers']} attackers neutralized "
+                  f"in {summary['steps']} steps ({summary['wall_time_s']}s)")
+
+    if index_rows:
+        with open(out_dir / "runs.csv", "w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=list(index_rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(index_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -39,4 +39,32 @@ class Cell:
 
     def __str__(self):
         return f"{self.id}, {self.pos_x}x{self.pos_y}, C={self.col}, R={self.row}"
-        
\ No newline at end of file
+
+
+class CellView:
+    """
+    Read only Cell look-alike backed by the Grid arrays.
+    Lets older code keep doing grid[row][col].pos_x without a Cell per cell.
+    """
+    __slots__ = ("owner", "row", "col")
+
+    def __init__(self, owner, row, col):
+        self.owner = owner
+        self.row = row
+        self.col = col
+
+    @property
+    def id(self):
+        # land(1) or water(0) like Cell
+        return 0 if self.owner.water[self.row, self.col] else 1
+
+    @property
+    def pos_x(self):
+        return float(self.owner.xs[self.col])
+
+    @property
+    def pos_y(self):
+        return float(self.owner.ys[self.row])
+
+    def __str__(self):
+        return f"{self.id}, {self.pos_x}x{self.pos_y}, C={self.col}, R={self.row}"
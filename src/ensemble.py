@@ -0,0 +1,173 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+"""
+Monte Carlo ensemble of one scenario over many seeds, spread over every core.
+
+Run from the src folder (or with src on the PYTHONPATH):
+    python -m ensemble ../configs/Demo.json
+        --shape ../data/shape_files/zipfolder/Harbour_Depth_Area.shp
+        --runs 1000 --steps 500 --out ../runs/demo_ensemble.json
+
+Each worker process builds the map, grid and spawns once in its
+initializer, then runs its chunks of seeds back to back.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+import batch
+
+# set once per worker process by init_worker
+WORKER_STATE = dict()
+
+
+def init_worker(shape_path, cells_n, spawns, max_steps, quiet=True):
+    """Build the world once for this worker"""
+    if quiet:
+        # the model prints a lot every step
+        sys.stdout = open(os.devnull, "w")
+    WORKER_STATE["world"] = batch.build_world(shape_path, cells_n)
+    WORKER_STATE["spawns"] = spawns
+    WORKER_STATE["max_steps"] = max_steps
+
+
+def run_chunk(seeds):
+    """Run a chunk of seeds inside a worker, returns the list of summaries"""
+    summaries = list()
+    for seed in seeds:
+        summary, _ = batch.run_scenario(WORKER_STATE["spawns"], WORKER_STATE["world"],
+                                        WORKER_STATE["max_steps"], seed=seed,
+                                        record_trajectories=False)
+        summaries.append(summary)
+    return summaries
+
+
+def chunk_seeds(seeds, workers, chunks_per_worker=4):
+    """Split the seeds into a few chunks per worker so the pool stays balanced"""
+    n_chunks = max(1, min(len(seeds), workers * chunks_per_worker))
+    return [chunk.tolist() for chunk in np.array_split(np.asarray(seeds, dtype=int), n_chunks) if len(chunk) > 0]
+
+
+def distribution(values):
+    """Histogram and moments of a list of ints"""
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return {"count": 0}
+    uniq, counts = np.unique(values, return_counts=True)
+    return {
+        "count": int(values.size),
+        "mean": float(values.mean()),
+        "std": float(values.std()),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "histogram": {str(int(v)): int(c) for v, c in zip(uniq, counts)},
+    }
+
+
+def merge_summaries(summaries):
+    """Merge per-seed summaries into outcome distributions"""
+    detect_steps = [s["first_detection_step"] for s in summaries if s["first_detection_step"] is not None]
+    time_to_detect = {"count": len(detect_steps),
+                      "detected_fraction": len(detect_steps) / len(summaries) if summaries else 0.0}
+    if detect_steps:
+        steps = np.asarray(detect_steps, dtype=float)
+        time_to_detect.update({
+            "mean": float(steps.mean()),
+            "std": float(steps.std()),
+            "p5": float(np.percentile(steps, 5)),
+            "p50": float(np.percentile(steps, 50)),
+            "p95": float(np.percentile(steps, 95)),
+        })
+    return {
+        "runs": len(summaries),
+        "targets_destroyed": distribution([s["targets_destroyed"] for s in summaries]),
+        "attackers_neutralized": distribution([s["attackers_neutralized"] for s in summaries]),
+        "time_to_detect": time_to_detect,
+    }
+
+
+def run_ensemble(spawns, shape_path, cells_n, max_steps, seeds, workers=None, chunks_per_worker=4):
+    """Run every seed of one scenario on a process pool, returns (merged, summaries)"""
+    workers = workers or os.cpu_count() or 1
+    chunks = chunk_seeds(seeds, workers, chunks_per_worker)
+    summaries = list()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(shape_path, cells_n, spawns, max_steps)) as pool:
+        for chunk_result in pool.map(run_chunk, chunks):
+            summaries.extend(chunk_result)
+    return merge_summaries(summaries), summaries
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo ensemble of one saved config")
+    parser.add_argument("config", help="config json file saved by the GUI")
+    parser.add_argument("--shape", required=True, help="shapefile of the map")
+    parser.add_argument("--cells", type=int, default=50, help="grid cells per side")
+    parser.add_argument("--steps", type=int, default=500, help="max model steps per run")
+    parser.add_argument("--runs", type=int, default=100, help="number of seeds")
+    parser.add_argument("--seed-start", type=int, default=0, help="first seed, seeds are consecutive")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, default all cores")
+    parser.add_argument("--chunks-per-worker", type=int, default=4, help="seed chunks handed to each worker")
+    parser.add_argument("--out", default="ensemble.json", help="merged result json, per seed csv goes next to it")
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # spawns are loaded once here and shipped to the workers
+    _, grid = batch.build_world(args.shape, args.cells)
+    spawns, warnings = batch.load_spawns(args.config, grid)
+    for w in warnings:
+        print(f"{args.config}: {w}")
+
+    seeds = list(range(args.seed_start, args.seed_start + args.runs))
+    start = time.perf_counter()
+    merged, summaries = run_ensemble(spawns, args.shape, args.cells, args.steps, seeds,
+                                     workers=args.workers, chunks_per_worker=args.chunks_per_worker)
+    merged["config"] = str(args.config)
+    merged["wall_time_s"] = round(time.perf_counter() - start, 4)
+
+    out_path = Path(args.out)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as fh:
+        json.dump(merged, fh, indent=2)
+    with open(out_path.with_suffix(".csv"), "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(summaries[0].keys()))
+        writer.writeheader()
+        writer.writerows(summaries)
+
+    print(f"{merged['runs']} runs in {merged['wall_time_s']}s")
+    print(f"targets destroyed: {merged['targets_destroyed']}")
+    print(f"attackers neutralized: {merged['attackers_neutralized']}")
+    print(f"time to detect: {merged['time_to_detect']}")
+
+
+if __name__ == "__main__":
+    main()
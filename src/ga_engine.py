@@ -0,0 +1,313 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+"""
+Array based GA pieces for the SearchAgent chromosomes.
+
+Chromosomes are stored as uint8 gene codes, a population is a padded
+(P, L) matrix plus a length per row, 0 is padding.
+"""
+
+import numpy as np
+
+# gene letter -> code, same numbering as UUVModel.AGENT_CHROMESOME_COMMAND
+GENE_CODES = {'L': 1, 'R': 2, 'U': 3, 'D': 4}
+GENE_LETTERS = {code: letter for letter, code in GENE_CODES.items()}
+# code -> (row, col) move, L/R change the row and U/D the column like SearchAgent.get_next_pos
+GENE_OFFSETS = np.array([[0, 0], [-1, 0], [1, 0], [0, -1], [0, 1]], dtype=np.int32)
+GENE_ROWS = GENE_OFFSETS[:, 0].astype(np.int16)
+GENE_COLS = GENE_OFFSETS[:, 1].astype(np.int16)
+
+
+def encode(chromosomes):
+    """Lists of gene letters -> (genes (P, L) uint8, lengths (P,)), unknown letters become 0"""
+    lengths = np.array([len(c) for c in chromosomes], dtype=np.int64)
+    width = int(lengths.max()) if len(lengths) else 0
+    genes = np.zeros((len(chromosomes), width), dtype=np.uint8)
+    for row, chromosome in enumerate(chromosomes):
+        genes[row, :len(chromosome)] = [GENE_CODES.get(g, 0) for g in chromosome]
+    return genes, lengths
+
+
+def decode(genes, lengths):
+    """(genes, lengths) -> lists of gene letters"""
+    return [[GENE_LETTERS.get(int(code), '?') for code in row[:n]] for row, n in zip(genes, lengths)]
+
+
+class Execution:
+    """Outcome of running a batch of chromosomes, every field is one value per chromosome"""
+    def __init__(self, final, failed, used, fitness):
+        self.final = final      # (P, 2) (row, col) the agent stopped on
+        self.failed = failed    # hit land or left the grid
+        self.used = used        # genes consumed, the failing one included
+        self.fitness = fitness  # manhattan distance from final to the target
+
+    @property
+    def finish_steps(self):
+        """Model steps SearchAgent.step needs before it is finished, one per gene plus the finishing step"""
+        return self.used + 1
+
+    def take(self, index):
+        """Outcomes at index, for mapping unique rows back onto a whole population"""
+        return Execution(self.final[index], self.failed[index], self.used[index], self.fitness[index])
+
+
+class ChromosomeExecutor:
+    """
+    Runs whole SearchAgent populations without stepping them.
+    Every chromosome's path is the cumulative sum of its move offsets from
+    the start cell; the first move off the grid or onto land is where it
+    fails and stops, like SearchAgent.get_next_pos. Fitness is worked out
+    in the same pass with the same rule as SearchAgent.calculate_fitness.
+    """
+    def __init__(self, water):
+        self.water = np.asarray(water).astype(bool)
+        self.ROW, self.COL = self.water.shape
+        # flat water mask with a ring of land around it
+        self.padded = np.pad(self.water, 1, constant_values=False).ravel()
+
+    def run(self, starts, genes, lengths, targets=(0, 0)):
+        """
+        starts (P, 2) and targets (P, 2) or (2,) are (row, col), genes and
+        lengths as from encode. Returns an Execution.
+        """
+        starts = np.asarray(starts, dtype=np.int64).reshape(-1, 2)
+        genes = np.asarray(genes, dtype=np.uint8).reshape(len(starts), -1)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        P, L = genes.shape
+        if P == 0 or L == 0:
+            final = starts.copy()
+            failed = np.zeros(P, dtype=bool)
+            return Execution(final, failed, lengths.copy(), self.fitness(final, targets))
+
+        # padding and unknown genes don't move, so they can never be the first bad move
+        rows = np.cumsum(GENE_ROWS[genes], axis=1, dtype=np.int16)
+        rows += starts[:, 0:1].astype(np.int16)
+        cols = np.cumsum(GENE_COLS[genes], axis=1, dtype=np.int16)
+        cols += starts[:, 1:2].astype(np.int16)
+        # off grid cells clip onto the land border of the padded mask
+        np.clip(rows, -1, self.ROW, out=rows)
+        np.clip(cols, -1, self.COL, out=cols)
+        cells = (rows.astype(np.int32) + 1) * (self.COL + 2) + (cols + 1)
+        bad = ~self.padded[cells]
+
+        failed = bad.any(axis=1)
+        first_bad = np.where(failed, bad.argmax(axis=1), lengths)
+        used = np.where(failed, first_bad + 1, lengths)
+        # the last good cell is just before the first bad move, the start if there is none
+        last = np.maximum(first_bad - 1, 0)
+        index = np.arange(P)
+        final = np.stack([rows[index, last], cols[index, last]], axis=1).astype(np.int64)
+        final = np.where((first_bad > 0)[:, None], final, starts)
+        return Execution(final, failed, used, self.fitness(final, targets))
+
+    @staticmethod
+    def fitness(final, targets):
+        """Manhattan distance to the target, lower is better"""
+        targets = np.asarray(targets, dtype=np.int64).reshape(-1, 2)
+        return np.abs(final - targets).sum(axis=1)
+
+
+class Population:
+    """
+    Chromosomes of one population as a padded (P, L) uint8 gene matrix and
+    a length per row. Operators return new populations and never touch
+    the rows past a chromosome's length, which stay 0.
+    """
+    def __init__(self, genes, lengths):
+        self.genes = np.asarray(genes, dtype=np.uint8)
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+
+    @classmethod
+    def random(cls, size, rng, min_length=10, max_length=30):
+        """size random chromosomes, lengths drawn in [min_length, max_length] like SearchAgent does for generation 0"""
+        lengths = rng.integers(min_length, max_length + 1, size=size)
+        genes = rng.integers(1, 5, size=(size, int(lengths.max()) if size else 0), dtype=np.uint8)
+        genes[np.arange(genes.shape[1])[None, :] >= lengths[:, None]] = 0
+        return cls(genes, lengths)
+
+    @classmethod
+    def from_chromosomes(cls, chromosomes):
+        return cls(*encode(chromosomes))
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def chromosomes(self):
+        """The rows as lists of gene letters"""
+        return decode(self.genes, self.lengths)
+
+    def take(self, index):
+        """Rows at index as a new population, trimmed to the longest of them"""
+        index = np.asarray(index, dtype=np.int64)
+        lengths = self.lengths[index]
+        width = int(lengths.max()) if len(lengths) else 0
+        return Population(self.genes[index, :width], lengths)
+
+    def unique(self):
+        """(population of the distinct chromosomes, index of every row in it)"""
+        lengths = self.lengths.astype(np.int64)[:, None].view(np.uint8)
+        rows = np.ascontiguousarray(np.concatenate([self.genes, lengths], axis=1))
+        keys = rows.view(np.dtype((np.void, rows.shape[1]))).ravel()
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        return self.take(first), inverse.ravel()
+
+    @staticmethod
+    def concat(populations):
+        width = max((p.genes.shape[1] for p in populations), default=0)
+        genes = np.concatenate([np.pad(p.genes, ((0, 0), (0, width - p.genes.shape[1]))) for p in populations])
+        return Population(genes, np.concatenate([p.lengths for p in populations]))
+
+    def grow(self, rows, n, rng):
+        """Append n random genes to the rows where rows is True"""
+        rows = np.asarray(rows, dtype=bool)
+        lengths = self.lengths + n * rows
+        width = int(lengths.max()) if len(lengths) else 0
+        genes = np.zeros((len(self), width), dtype=np.uint8)
+        genes[:, :self.genes.shape[1]] = self.genes
+        j = np.arange(width)[None, :]
+        new = rows[:, None] & (j >= self.lengths[:, None]) & (j < lengths[:, None])
+        genes[new] = rng.integers(1, 5, size=int(new.sum()), dtype=np.uint8)
+        return Population(genes, lengths)
+
+
+def select_best(fitness, k):
+    """Indexes of the k lowest fitness values, ties keep their order like sorted()"""
+    return np.argsort(fitness, kind="stable")[:k]
+
+
+def midpoint_crossover(population, a, b):
+    """Children a[:len(a)//2] + b[len(b)//2:] for every (a, b) pair, like SearchAgent.mate"""
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    # few parents breed many children, build each distinct pair once and copy rows
+    pairs, inverse = np.unique(a * len(population) + b, return_inverse=True)
+    a, b = pairs // len(population), pairs % len(population)
+    la, lb = population.lengths[a], population.lengths[b]
+    ma, mb = la // 2, lb // 2
+    lengths = ma + (lb - mb)
+    width = int(lengths.max()) if len(lengths) else 0
+    j = np.arange(width)[None, :]
+    from_a = j < ma[:, None]
+    rows = np.where(from_a, a[:, None], b[:, None])
+    cols = np.where(from_a, j, j - ma[:, None] + mb[:, None])
+    cols = np.clip(cols, 0, max(population.genes.shape[1] - 1, 0))
+    genes = np.where(j < lengths[:, None], population.genes[rows, cols], 0).astype(np.uint8)
+    inverse = inverse.ravel()
+    return Population(genes[inverse], lengths[inverse])
+
+
+def uniform_crossover(population, a, b, rng):
+    """Children as long as a, each gene both parents have comes from either one at random"""
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    genes = population.genes[a].copy()
+    lengths = population.lengths[a]
+    both = np.arange(genes.shape[1])[None, :] < np.minimum(lengths, population.lengths[b])[:, None]
+    pick_b = both & (rng.random(genes.shape) < 0.5)
+    genes[pick_b] = population.genes[b][pick_b]
+    return Population(genes, lengths)
+
+
+def mutate(population, rate, rng):
+    """Every gene is redrawn from the four moves with probability rate, like SearchAgent.mutate_genes"""
+    draw = rng.random(population.genes.shape, dtype=np.float32)
+    hit = draw < rate
+    hit &= np.arange(draw.shape[1])[None, :] < population.lengths[:, None]
+    # a draw under rate is uniform on [0, rate), reuse it to pick the new move
+    moves = np.minimum(draw * (4 / rate), 3).astype(np.uint8) + 1 if rate > 0 else 0
+    genes = np.where(hit, moves, population.genes).astype(np.uint8)
+    return Population(genes, population.lengths.copy())
+
+
+class GeneticSearch:
+    """
+    Headless GA for one spawn group on Population matrices, the same scheme
+    as the model by default: finishers grow by grow genes, the best elite
+    are kept and the rest are bred from the best parents and mutated.
+    """
+    def __init__(self, executor, start, target=(0, 0), pop_size=10, rng=None, mutation_rate=0.5,
+                 elite=2, parents=2, crossover="midpoint", grow=5, dedupe=False, population=None):
+        if crossover not in ("midpoint", "uniform"):
+            raise ValueError(f"Unknown crossover {crossover}, expected midpoint or uniform")
+        self.executor = executor
+        # run every distinct chromosome once, worth it when mutation leaves many children identical
+        self.dedupe = dedupe
+        self.start = tuple(start)
+        self.target = tuple(target)
+        self.pop_size = pop_size
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.mutation_rate = mutation_rate
+        self.elite = min(elite, pop_size)
+        self.parents = max(1, min(parents, pop_size))
+        self.crossover = crossover
+        self.grow = grow
+        # a population to carry on from, a random one like generation 0 otherwise
+        self.population = population if population is not None else Population.random(pop_size, self.rng)
+        self.generation = 0
+        self.best_fitness = list()  # best fitness of every generation run so far
+
+    def evaluate(self, population):
+        """Run every chromosome from the group's spawn, returns the Execution"""
+        if self.dedupe:
+            unique, inverse = population.unique()
+            return self.run_population(unique).take(inverse)
+        return self.run_population(population)
+
+    def run_population(self, population):
+        starts = np.broadcast_to(np.asarray(self.start, dtype=np.int64), (len(population), 2))
+        return self.executor.run(starts, population.genes, population.lengths, self.target)
+
+    def step(self):
+        """Evaluate the current population and replace it with the next generation"""
+        result = self.evaluate(self.population)
+        population = self.population.grow(~result.failed, self.grow, self.rng) if self.grow else self.population
+        order = select_best(result.fitness, len(population))
+        self.best_fitness.append(int(result.fitness[order[0]]))
+
+        n_children = self.pop_size - self.elite
+        pool = order[:self.parents]
+        if self.parents == 1:
+            a = b = np.full(n_children, pool[0])
+        elif self.parents == 2:
+            # the model always breeds the best with the second best
+            a, b = np.full(n_children, pool[0]), np.full(n_children, pool[1])
+        else:
+            first = self.rng.integers(0, self.parents, size=n_children)
+            second = (first + self.rng.integers(1, self.parents, size=n_children)) % self.parents
+            a, b = pool[first], pool[second]
+        if self.crossover == "midpoint":
+            children = midpoint_crossover(population, a, b)
+        else:
+            children = uniform_crossover(population, a, b, self.rng)
+        children = mutate(children, self.mutation_rate, self.rng)
+
+        self.population = Population.concat([population.take(order[:self.elite]), children])
+        self.generation += 1
+        return result
+
+    def run(self, generations):
+        for _ in range(generations):
+            self.step()
+        return self
+
+    def best(self):
+        """(chromosome letters, fitness) of the best of the current population"""
+        result = self.evaluate(self.population)
+        i = int(select_best(result.fitness, 1)[0])
+        return self.population.take([i]).chromosomes()[0], int(result.fitness[i])
@@ -0,0 +1,301 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+"""
+GA generations for the GA spawn groups on a process pool.
+
+Run from the src folder (or with src on the PYTHONPATH):
+    python -m ga_pool ../configs/demo2.json
+        --shape ../data/shape_files/zipfolder/Harbour_Depth_Area.shp
+        --generations 100 --pop-size 1000 --workers 4 --out ../runs/demo2_ga.json
+
+Each worker process gets the water mask and target once in its
+initializer. The spawn groups are independent, by default every group's
+GeneticSearch runs in a worker of its own. With --split the groups run
+one after another in this process, which only does the selection and
+breeding, and every generation is evaluated in chunks on the pool.
+
+With --islands K every group is split into K islands that evolve in
+separate workers. Every --migration-interval generations the islands come
+back, their best --migrants chromosomes replace the worst of the islands
+next to them on the --topology, and the next epoch is handed out again.
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+import batch
+from ga_engine import ChromosomeExecutor, Execution, GeneticSearch, Population, select_best
+
+# set once per worker process by init_worker
+WORKER_STATE = dict()
+
+
+def init_worker(water, target):
+    """Keep the executor and target for this worker"""
+    WORKER_STATE["executor"] = ChromosomeExecutor(water)
+    WORKER_STATE["target"] = tuple(target)
+
+
+def evaluate_chunk(starts, genes, lengths):
+    """Execution fields (final, failed, used, fitness) of a chunk of chromosomes inside a worker"""
+    result = WORKER_STATE["executor"].run(starts, genes, lengths, WORKER_STATE["target"])
+    return result.final, result.failed, result.used, result.fitness
+
+
+def run_group(group_id, start, generations, seed, options):
+    """Run one group's GeneticSearch inside a worker, returns its result dict"""
+    search = GeneticSearch(WORKER_STATE["executor"], start, WORKER_STATE["target"],
+                           rng=np.random.default_rng(seed), **options)
+    return group_result(group_id, search.run(generations))
+
+
+def evolve_island(island, generations, options):
+    """Run one island for an epoch inside a worker, returns it with its population best first"""
+    search = GeneticSearch(WORKER_STATE["executor"], island["start"], WORKER_STATE["target"],
+                           rng=island["rng"], population=island["population"], **options)
+    search.run(generations)
+    result = search.evaluate(search.population)
+    order = select_best(result.fitness, len(result.fitness))
+    return {
+        "start": island["start"],
+        "rng": search.rng,
+        "population": search.population.take(order),
+        "fitness": result.fitness[order],
+        "generation": island["generation"] + generations,
+        "fitness_history": island["fitness_history"] + search.best_fitness,
+    }
+
+
+def neighbours(k, topology):
+    """Islands each island sends its migrants to"""
+    if topology == "ring":
+        return [[(i + 1) % k] if k > 1 else [] for i in range(k)]
+    if topology == "all":
+        return [[j for j in range(k) if j != i] for i in range(k)]
+    raise ValueError(f"Unknown topology {topology}, expected ring or all")
+
+
+def migrate(islands, migrants, topology):
+    """Replace the worst of every island with the best migrants of the islands sending to it"""
+    incoming = [list() for _ in islands]
+    for i, targets in enumerate(neighbours(len(islands), topology)):
+        best = islands[i]["population"].take(np.arange(min(migrants, len(islands[i]["population"]))))
+        for j in targets:
+            incoming[j].append(best)
+    for island, arrivals in zip(islands, incoming):
+        if not arrivals:
+            continue
+        arrivals = Population.concat(arrivals)
+        population = island["population"]
+        # an island keeps at least its best chromosome
+        n = min(len(arrivals), len(population) - 1)
+        island["population"] = Population.concat([population.take(np.arange(len(population) - n)),
+                                                  arrivals.take(np.arange(n))])
+
+
+def group_result(group_id, search):
+    chromosome, fitness = search.best()
+    return {
+        "group_id": group_id,
+        "start": list(search.start),
+        "generations": search.generation,
+        "best_fitness": fitness,
+        "best_chromosome": "".join(chromosome),
+        "fitness_history": search.best_fitness,
+    }
+
+
+class PoolEvaluator:
+    """
+    Drop in for ChromosomeExecutor in GeneticSearch that evaluates every
+    population in chunks on the pool. The workers only know their own
+    target, asking for another one is an error.
+    """
+    def __init__(self, pool, target, chunks):
+        self.pool = pool
+        self.target = tuple(target)
+        self.chunks = max(1, chunks)
+
+    def run(self, starts, genes, lengths, targets=(0, 0)):
+        if not np.all(np.asarray(targets).reshape(-1, 2) == self.target):
+            raise ValueError(f"The workers evaluate against {self.target}, got {targets}")
+        starts = np.asarray(starts, dtype=np.int64).reshape(-1, 2)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        parts = np.array_split(np.arange(len(lengths)), min(self.chunks, max(1, len(lengths))))
+        jobs = [(starts[p], genes[p], lengths[p]) for p in parts]
+        results = list(self.pool.map(evaluate_chunk, *zip(*jobs)))
+        final, failed, used, fitness = (np.concatenate(field) for field in zip(*results))
+        return Execution(final, failed, used, fitness)
+
+
+def ga_groups(spawns):
+    """(row, col) start of every GA spawn, in group_id order like UUVModel"""
+    starts = list()
+    for spawn_list in spawns.values():
+        for spawn_data in spawn_list:
+            if spawn_data.get('type') == "GA":
+                x, y = spawn_data.get('pos')
+                starts.append((int(y), int(x)))
+    return starts
+
+
+def group_seeds(seed, n):
+    """Independent seeds per group, the same whatever the worker count"""
+    return [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(n)]
+
+
+def run_groups(water, starts, generations, target=(0, 0), seed=None, workers=None, split=False, **options):
+    """Run a GeneticSearch per group on a process pool, returns the result dicts in group order"""
+    workers = workers or os.cpu_count() or 1
+    seeds = group_seeds(seed, len(starts))
+    results = list()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(np.asarray(water, dtype=bool), target)) as pool:
+        if split:
+            evaluator = PoolEvaluator(pool, target, workers)
+            for group_id, (start, group_seed) in enumerate(zip(starts, seeds)):
+                search = GeneticSearch(evaluator, start, target, rng=np.random.default_rng(group_seed), **options)
+                results.append(group_result(group_id, search.run(generations)))
+        else:
+            jobs = [pool.submit(run_group, group_id, start, generations, group_seed, options)
+                    for group_id, (start, group_seed) in enumerate(zip(starts, seeds))]
+            results = [job.result() for job in jobs]
+    return results
+
+
+def run_islands(water, starts, generations, islands=4, interval=10, migrants=2, topology="ring",
+                target=(0, 0), seed=None, workers=None, pop_size=10, **options):
+    """
+    Island model GA per group on a process pool, pop_size is split over the
+    islands. Every island needs more than the elite it keeps to breed at all,
+    islands is lowered until it does. Returns the result dicts in group order,
+    with the best island's chromosome and every island's fitness history.
+    """
+    neighbours(islands, topology)  # check the topology before starting the pool
+    elite = options.get("elite", 2)
+    max_islands = pop_size // (elite + 1)
+    if max_islands < 1:
+        raise ValueError(f"pop_size {pop_size} leaves no children after the {elite} elite")
+    if islands > max_islands:
+        print(f"{islands} islands of {pop_size // islands} can't breed past the {elite} elite, using {max_islands}")
+        islands = max_islands
+    workers = workers or os.cpu_count() or 1
+    island_size = pop_size // islands
+    options = dict(options, pop_size=island_size)
+    groups = list()
+    for start, group_seed in zip(starts, group_seeds(seed, len(starts))):
+        rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(group_seed).spawn(islands)]
+        groups.append([{"start": tuple(start), "rng": rng, "population": Population.random(island_size, rng),
+                        "generation": 0, "fitness_history": list()} for rng in rngs])
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(np.asarray(water, dtype=bool), target)) as pool:
+        done = 0
+        while done < generations:
+            epoch = min(interval, generations - done)
+            # every island of every group runs its epoch at the same time
+            jobs = [[pool.submit(evolve_island, island, epoch, options) for island in group] for group in groups]
+            groups = [[job.result() for job in group_jobs] for group_jobs in jobs]
+            done += epoch
+            if done < generations:
+                for group in groups:
+                    migrate(group, migrants, topology)
+
+    results = list()
+    for group_id, group in enumerate(groups):
+        best = min(range(islands), key=lambda i: (int(group[i]["fitness"][0]), i))
+        results.append({
+            "group_id": group_id,
+            "start": list(group[best]["start"]),
+            "generations": group[best]["generation"],
+            "best_fitness": int(group[best]["fitness"][0]),
+            "best_chromosome": "".join(group[best]["population"].take([0]).chromosomes()[0]),
+            "best_island": best,
+            "island_fitness_history": [island["fitness_history"] for island in group],
+        })
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the GA spawn groups of a saved config headless")
+    parser.add_argument("config", help="config json file saved by the GUI")
+    parser.add_argument("--shape", required=True, help="shapefile of the map")
+    parser.add_argument("--cells", type=int, default=50, help="grid cells per side")
+    parser.add_argument("--generations", type=int, default=50, help="generations per group")
+    parser.add_argument("--pop-size", type=int, default=10, help="chromosomes per group")
+    parser.add_argument("--mutation-rate", type=float, default=0.5, help="chance each gene is redrawn")
+    parser.add_argument("--parents", type=int, default=2, help="best chromosomes children are bred from")
+    parser.add_argument("--crossover", choices=("midpoint", "uniform"), default="midpoint")
+    parser.add_argument("--target", type=int, nargs=2, default=[0, 0], metavar=("ROW", "COL"),
+                        help="cell the chromosomes are scored against")
+    parser.add_argument("--seed", type=int, default=None, help="seed for every group's rng")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, default all cores")
+    parser.add_argument("--split", action="store_true",
+                        help="split each generation over the pool instead of a group per worker")
+    parser.add_argument("--islands", type=int, default=1,
+                        help="islands per group, the population is split over them")
+    parser.add_argument("--migration-interval", type=int, default=10, help="generations between migrations")
+    parser.add_argument("--migrants", type=int, default=2, help="best chromosomes each island sends")
+    parser.add_argument("--topology", choices=("ring", "all"), default="ring",
+                        help="ring sends to the next island, all to every other one")
+    parser.add_argument("--dedupe", action="store_true", help="evaluate each distinct chromosome once per generation")
+    parser.add_argument("--out", default="ga_groups.json", help="result json")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    _, grid = batch.build_world(args.shape, args.cells)
+    spawns, warnings = batch.load_spawns(args.config, grid)
+    for w in warnings:
+        print(f"{args.config}: {w}")
+    starts = ga_groups(spawns)
+    if not starts:
+        print(f"{args.config} has no GA spawns")
+        return
+
+    start = time.perf_counter()
+    options = dict(target=args.target, seed=args.seed, workers=args.workers, dedupe=args.dedupe,
+                   pop_size=args.pop_size, mutation_rate=args.mutation_rate, parents=args.parents,
+                   crossover=args.crossover)
+    if args.islands > 1:
+        results = run_islands(grid.water, starts, args.generations, islands=args.islands,
+                              interval=args.migration_interval, migrants=args.migrants,
+                              topology=args.topology, **options)
+    else:
+        results = run_groups(grid.water, starts, args.generations, split=args.split, **options)
+    wall_time = round(time.perf_counter() - start, 4)
+
+    out_path = Path(args.out)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as fh:
+        json.dump({"config": str(args.config), "wall_time_s": wall_time, "groups": results}, fh, indent=2)
+
+    print(f"{len(results)} groups, {args.generations} generations of {args.pop_size} in {wall_time}s")
+    for r in results:
+        print(f"group {r['group_id']} from {r['start']}: best fitness {r['best_fitness']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,25 +17,49 @@
 # - Prof. Hang Dinh, CIS, Indiana University South Bend
 
 import math
-import tkinter as tk
 import numpy as np
-from cell import Cell
+from cell import CellView
 from map import MapControl
+from pathfinding import PathEngine
 
 class Grid:
+    """
+    Water/land grid over the canvas.
+    water is a uint8 mask (1 water, 0 land) indexed [row, col], xs and ys are the
+    pixel coords of the columns and rows. grid is a Cell-like view for older callers.
+    """
 
-    def __init__(self, width, height, cells_n, canvas):
+    def __init__(self, width, height, cells_n, canvas=None, map=None):
         self.width = width
         self.height = height
         self.cells_n = cells_n
-        self.grid = []
         self.canvas = canvas
+        self.map = map
         self.img_tk = None
+        if self.canvas is None and self.map is None:
+            raise ValueError("Grid needs a map or a canvas to find the water")
         self.row_space = self.get_cell_spacing(self.width)  #rows involve width
         self.col_space = self.get_cell_spacing(self.height) #cols involve hieght
         self.cell_size = self.row_space
+        self.water = np.zeros((self.cells_n, self.cells_n), dtype=np.uint8)
+        self.xs = np.arange(self.cells_n, dtype=np.float32) * self.col_space
+        self.ys = np.arange(self.cells_n, dtype=np.float32) * self.row_space
+        self.grid = GridView(self)
+        self._path_engine = None
+        self.version = 0 # bumped whenever the water mask is rebuilt
         self.draw_test_grid()
 
+    @property
+    def shape(self):
+        return self.water.shape
+
+    @property
+    def path_engine(self):
+        """A* engine over the water mask, built on first use and shared by every agent"""
+        if self._path_engine is None:
+            self._path_engine = PathEngine(self.water)
+        return self._path_engine
+
     def get_cell_spacing(self, length):
         """
         returns the cell spacing for the grid
@@ -45,41 +69,72 @@ class Grid:
         remaining_space = length - total_obj_width
         num_of_spaces = self.cells_n - 1
         individual_spaces = remaining_space // num_of_spaces
+        if individual_spaces < 1:
+            # too many cells for whole pixel spacing, spread them over the length
+            individual_spaces = length / self.cells_n
         return individual_spaces
     
     def draw_test_grid(self):
         """Creates the grid"""
-        pos_x = 0
-        pos_y = 0
-        radius = 1
+        if self.map is not None:
+            # rasterize straight from the map geometry, no canvas needed
+            self.water = self.load_cached_water()
+            if self.water is None:
+                self.water = self.map.water_mask(self.xs, self.ys)
+                self.save_cached_water()
+        else:
+            self.water = self.canvas_water_mask()
+        self._path_engine = None # water changed, rebuild on next search
+        self.version += 1
+        if self.canvas is not None:
+            self.draw_cells()
+
+    def load_cached_water(self):
+        """Water mask from the map cache, None on a miss"""
+        cache = getattr(self.map, "cache", None)
+        if cache is None or self.map.shape_hash is None:
+            return None
+        data = cache.load_grid(self.map.shape_hash, (self.width, self.height), self.cells_n)
+        if data is None:
+            return None
+        # spacing changes would silently shift every cell, treat as a miss
+        if not (np.array_equal(data["xs"], self.xs) and np.array_equal(data["ys"], self.ys)):
+            return None
+        return data["water"]
+
+    def save_cached_water(self):
+        """Store the water mask in the map cache"""
+        cache = getattr(self.map, "cache", None)
+        if cache is None or self.map.shape_hash is None:
+            return
+        cache.save_grid(self.map.shape_hash, (self.width, self.height), self.cells_n,
+                        water=self.water, xs=self.xs, ys=self.ys)
+
+    def canvas_water_mask(self):
+        """Old per cell canvas hit test, only used when there is no map"""
+        water = np.zeros((self.cells_n, self.cells_n), dtype=np.uint8)
+        target_ojb = self.canvas.find_withtag("map")
         for row in range(self.cells_n): # iterate down the screen
-            tmp = []
-            is_water = False
+            pos_y = float(self.ys[row])
             for col in range(self.cells_n): # iterate across the screen
+                pos_x = float(self.xs[col])
                 ovrlap_obj = self.canvas.find_overlapping(pos_x, pos_y, pos_x, pos_y)
-                target_ojb = self.canvas.find_withtag("map")
                 for id in ovrlap_obj:
                     if id in target_ojb:
-                        is_water = True
-                        break                       
-                if is_water:
-                    cell = Cell(id=0)
-                    cell.pos_x = pos_x
-                    cell.pos_y = pos_y
-                    cell.row = row
-                    cell.col = col
-                    self.canvas.create_oval(pos_x-radius, pos_y-radius, pos_x+radius, pos_y+radius, fill='white', tags='cell')
-                else:
-                    cell = Cell(id=1)
-                    self.canvas.create_oval(pos_x-radius, pos_y-radius, pos_x+radius, pos_y+radius, fill='red', tags='cell')
-                tmp.append(cell)
-                pos_x += self.col_space
-                is_water = False
-
-            self.grid.append(tmp)
-            pos_y += self.row_space
-            pos_x = 0
-        
+                        water[row, col] = 1
+                        break
+        return water
+
+    def draw_cells(self):
+        """Draw the cell dots, white for water and red for land"""
+        radius = 1
+        for row in range(self.cells_n):
+            pos_y = float(self.ys[row])
+            for col in range(self.cells_n):
+                pos_x = float(self.xs[col])
+                fill = 'white' if self.water[row, col] else 'red'
+                self.canvas.create_oval(pos_x-radius, pos_y-radius, pos_x+radius, pos_y+radius, fill=fill, tags='cell')
+
     def get_locations(self, start, end):
         self.grid
         def find_cell(pos, cells):
@@ -101,13 +156,89 @@ class Grid:
         """
         print(f'Grid length: {len(self.grid)}')
         grid_string = ""
-        for row in self.grid:
-            for cell in row:
-                grid_string += str(cell.id) + " "
-            grid_string += "\n"
+        for row in (1 - self.water):
+            grid_string += " ".join(str(id) for id in row) + "\n"
         return grid_string.strip()
 
 
+class GridRowView:
+    """One row of the GridView, grid[row][col] gives a CellView"""
+    __slots__ = ("owner", "row")
+
+    def __init__(self, owner, row):
+        self.owner = owner
+        self.row = row
+
+    def __len__(self):
+        return self.owner.water.shape[1]
+
+    def __getitem__(self, col):
+        cols = self.owner.water.shape[1]
+        if col < 0:
+            col += cols
+        if col < 0 or col >= cols:
+            raise IndexError("grid column out of range")
+        return CellView(self.owner, self.row, col)
+
+    def __iter__(self):
+        for col in range(len(self)):
+            yield CellView(self.owner, self.row, col)
+
+
+class GridView:
+    """
+    Cell compatible view of a Grid, supports len(), grid[row][col] and iteration.
+    Arrays are shared with the Grid, nothing is copied.
+    """
+    __slots__ = ("owner",)
+
+    def __init__(self, owner):
+        self.owner = owner
+
+    @property
+    def shape(self):
+        return self.owner.water.shape
+
+    @property
+    def water(self):
+        return self.owner.water
+
+    @property
+    def xs(self):
+        return self.owner.xs
+
+    @property
+    def ys(self):
+        return self.owner.ys
+
+    @property
+    def cell_size(self):
+        return self.owner.cell_size
+
+    @property
+    def path_engine(self):
+        return self.owner.path_engine
+
+    @property
+    def version(self):
+        return self.owner.version
+
+    def __len__(self):
+        return self.owner.water.shape[0]
+
+    def __getitem__(self, row):
+        rows = self.owner.water.shape[0]
+        if row < 0:
+            row += rows
+        if row < 0 or row >= rows:
+            raise IndexError("grid row out of range")
+        return GridRowView(self.owner, row)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield GridRowView(self.owner, row)
+
+
 
 
 
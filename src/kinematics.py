@@ -0,0 +1,145 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import numpy as np
+
+# movement modes
+SEEK = 0   # Speed * round(unit vector) toward the waypoint, lands on it exactly (seekers)
+CHASE = 1  # speed along the unit vector toward the chased slot or the waypoint (CUUVs)
+
+
+class Kinematics:
+    """
+    Struct of arrays for every mobile agent, owned by the model.
+    Each agent holds a slot; its position, previous position, velocity,
+    waypoint, speed and moving flag live in contiguous float32 arrays and
+    advance() moves them all at once. Seekers move before chasers so a CUUV
+    always heads for where its target is after this step's move.
+    """
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self.size = 0            # slots ever handed out, live or free
+        self.free = list()       # released slots to reuse
+        self.agents = list()     # slot -> agent, None when free
+        self.pos = np.zeros((0, 2), dtype=np.float32)
+        self.prev_pos = np.zeros((0, 2), dtype=np.float32)
+        self.vel = np.zeros((0, 2), dtype=np.float32)
+        self.waypoint = np.zeros((0, 2), dtype=np.float32)
+        self.speed = np.zeros(0, dtype=np.float32)
+        self.mode = np.zeros(0, dtype=np.int8)
+        self.chase = np.zeros(0, dtype=np.int32)     # slot being chased, -1 for the waypoint
+        self.moving = np.zeros(0, dtype=bool)
+        self.grow(capacity)
+
+    def grow(self, capacity):
+        """Reallocate every array with room for capacity slots"""
+        def resize(arr, fill=0):
+            new = np.full((capacity,) + arr.shape[1:], fill, dtype=arr.dtype)
+            new[:len(arr)] = arr
+            return new
+        self.pos = resize(self.pos)
+        self.prev_pos = resize(self.prev_pos)
+        self.vel = resize(self.vel)
+        self.waypoint = resize(self.waypoint)
+        self.speed = resize(self.speed)
+        self.mode = resize(self.mode)
+        self.chase = resize(self.chase, -1)
+        self.moving = resize(self.moving, False)
+        self.capacity = capacity
+
+    def add(self, agent, position, speed, mode, moving=True):
+        """Give an agent a slot, it starts parked on its own position"""
+        if self.free:
+            slot = self.free.pop()
+            self.agents[slot] = agent
+        else:
+            if self.size == self.capacity:
+                self.grow(max(64, self.capacity * 2))
+            slot = self.size
+            self.size += 1
+            self.agents.append(agent)
+        self.pos[slot] = position
+        self.prev_pos[slot] = position
+        self.waypoint[slot] = position
+        self.vel[slot] = 0
+        self.speed[slot] = speed
+        self.mode[slot] = mode
+        self.chase[slot] = -1
+        self.moving[slot] = moving
+        return slot
+
+    def release(self, slot):
+        """Free a slot, anything chasing it stops"""
+        self.agents[slot] = None
+        self.moving[slot] = False
+        self.chase[self.chase[:self.size] == slot] = -1
+        self.free.append(slot)
+
+    def clear(self):
+        """Drop every slot"""
+        self.size = 0
+        self.free.clear()
+        self.agents.clear()
+        self.moving[:] = False
+        self.chase[:] = -1
+
+    def set_waypoint(self, slot, xy):
+        self.waypoint[slot] = xy
+
+    def set_chase(self, slot, target_slot):
+        """Chase another slot, None to go back to the fixed waypoint"""
+        self.chase[slot] = -1 if target_slot is None else target_slot
+
+    def set_moving(self, slot, moving):
+        self.moving[slot] = moving
+
+    def at_waypoint(self, slot):
+        return bool(self.pos[slot, 0] == self.waypoint[slot, 0] and self.pos[slot, 1] == self.waypoint[slot, 1])
+
+    def advance(self):
+        """Move every moving slot one step, returns the slots that moved"""
+        n = self.size
+        self.prev_pos[:n] = self.pos[:n]
+        moving = self.moving[:n]
+        mode = self.mode[:n]
+
+        seek = np.flatnonzero(moving & (mode == SEEK))
+        if seek.size:
+            d = self.waypoint[seek] - self.pos[seek]
+            mag = np.hypot(d[:, 0], d[:, 1])
+            go = mag > 0
+            seek, d, mag = seek[go], d[go], mag[go]
+            step = self.speed[seek, None] * np.round(d / mag[:, None])
+            # land on the waypoint rather than overshoot it when Speed > 1
+            arrive = np.hypot(step[:, 0], step[:, 1]) >= mag
+            step[arrive] = d[arrive]
+            self.pos[seek] += step
+
+        chase = np.flatnonzero(moving & (mode == CHASE))
+        if chase.size:
+            targets = self.chase[chase]
+            has_target = targets >= 0
+            self.waypoint[chase[has_target]] = self.pos[targets[has_target]]
+            d = self.waypoint[chase] - self.pos[chase]
+            mag = np.hypot(d[:, 0], d[:, 1])
+            go = mag > 0
+            chase, d, mag = chase[go], d[go], mag[go]
+            self.pos[chase] += d / mag[:, None] * self.speed[chase, None]
+
+        self.vel[:n] = self.pos[:n] - self.prev_pos[:n]
+        return np.flatnonzero(np.any(self.vel[:n] != 0, axis=1))
@@ -16,10 +16,10 @@
 # - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
 # - Prof. Hang Dinh, CIS, Indiana University South Bend
 
-import tkinter as tk
 import numpy as np
 import pandas as pd
 import geopandas as gpd
+import shapely
 from shapely.geometry import Point, shape, MultiPoint, Polygon
 import os
 from shapely.ops import triangulate, unary_union
@@ -30,11 +30,18 @@ from shapely.ops import triangulate, unary_union
 
 class MapControl():
 
-    def __init__(self, canvas, shallow_color =None, deep_color = None, shape_path = None):
+    def __init__(self, canvas, shallow_color =None, deep_color = None, shape_path = None, cache = None):
         
-        # required 
+        # required, canvas can be None for headless runs
         self.canvas = canvas
+        self.cache = cache # optional MapCache, skips the shapefile parse on a hit
+        self.shape_hash = None
+        self.shp = None
         self.polygon_ids={}
+        self.polygons = [] # scaled polygons in canvas pixels, drawn or not
+        self.water_geometry = None # union of the map polygons in map coords
+        self.bounds = None
+        self.scale = 1
         self.selected_polygon_id = None
         self.min_depth = 0
         self.max_depth = 0
@@ -55,13 +62,16 @@ class MapControl():
             self.deep_color = deep_color
 
         self.map_init(shape_path)
-        self.canvas.tag_raise('cell')
+        if self.canvas is not None:
+            self.canvas.tag_raise('cell')
 
     def depth_loc(self, x, y):
         """
         Returns the depth of the area polygon
         """
         self.selected_polygon_id
+        if self.canvas is None:
+            return None
 
         closest_items = self.canvas.find_closest(x+5, y+5) 
 
@@ -113,7 +123,23 @@ class MapControl():
             print("No map selected")
             return
 
-        shape_path = shp_path
+        if self.cache is None:
+            self.read_shapefile(shp_path)
+        else:
+            canvas_size = (self.canvas_width, self.canvas_height)
+            self.shape_hash = self.cache.shapefile_hash(shp_path)
+            data = self.cache.load_map(self.shape_hash, canvas_size)
+            if data is not None:
+                self.load_cached_map(data)
+            else:
+                self.read_shapefile(shp_path)
+                self.cache.save_map(self.shape_hash, canvas_size, **self.cache_arrays())
+        self.draw_map()
+
+    def read_shapefile(self, shape_path):
+        """
+        Parses the shapefile and scales the polygons to the canvas
+        """
         self.shp = gpd.read_file(shape_path)
         self.min_depth = self.shp['DRVAL2'].min()
         self.max_depth = self.shp['DRVAL2'].max()
@@ -129,6 +155,12 @@ class MapControl():
         y_scale = (self.canvas_height - buffer) / geo_height
 
         scale = min(x_scale, y_scale)
+        self.bounds = (minx, miny, maxx, maxy)
+        self.scale = scale
+
+        # one geometry for the land/water tests, prepared so point queries are fast
+        self.water_geometry = shapely.union_all(shapely.make_valid(self.shp.geometry.values))
+        shapely.prepare(self.water_geometry)
 
         x_offset = (self.canvas_width - geo_width * scale) / 2
         y_offset = (self.canvas_height - geo_height * scale) / 2
@@ -149,11 +181,7 @@ class MapControl():
                     new_x = (x_geo - minx) * scale # + x_offset
                     new_y = (maxy - y_geo) * scale # + y_offset
                     scaled_coords.extend([new_x, new_y])
-                # get depth color
-                fill_color = self.set_depth_color(depth2, self.min_depth, self.max_depth)
-                # Draw the scaled polygon on the canvas and store in dictinary
-                id=self.canvas.create_polygon(scaled_coords, fill=fill_color, width=0, tags="map")
-                self.polygon_ids[id]={"depth1": depth1, "depth2": depth2, "color": fill_color}
+                self.add_polygon(scaled_coords, depth1, depth2)
             elif geometry.geom_type == 'MultiPolygon':
                 # Iterate through each polygon within the MultiPolygon cause i was lazy
                 for polygon in geometry.geoms:
@@ -165,20 +193,80 @@ class MapControl():
                             new_x = (x_geo - minx) * scale
                             new_y = (maxy - y_geo) * scale
                             scaled_coords.extend([new_x, new_y])
-
-                        fill_color = self.set_depth_color(depth2, self.min_depth, self.max_depth)
-                        id = self.canvas.create_polygon(scaled_coords, fill=fill_color, width=0, tags="map")
-                        self.polygon_ids[id] = {"depth1": depth1, "depth2": depth2, "color": fill_color}
+                        self.add_polygon(scaled_coords, depth1, depth2)
                
+    def add_polygon(self, scaled_coords, depth1, depth2):
+        """
+        Stores the scaled polygon, drawn later by draw_map
+        """
+        self.polygons.append({"coords": scaled_coords, "depth1": depth1, "depth2": depth2})
+
+    def draw_map(self):
+        """
+        Draws the scaled polygons if there is a canvas
+        """
+        if self.canvas is None:
+            return
+        for polygon in self.polygons:
+            depth1 = polygon["depth1"]
+            depth2 = polygon["depth2"]
+            # get depth color
+            fill_color = self.set_depth_color(depth2, self.min_depth, self.max_depth)
+            # Draw the scaled polygon on the canvas and store in dictinary
+            id = self.canvas.create_polygon(polygon["coords"], fill=fill_color, width=0, tags="map")
+            self.polygon_ids[id] = {"depth1": depth1, "depth2": depth2, "color": fill_color}
+
+    def cache_arrays(self):
+        """
+        Flattens the processed map into arrays for the MapCache
+        """
+        coords = [np.asarray(polygon["coords"], dtype=np.float64) for polygon in self.polygons]
+        offsets = np.zeros(len(coords) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(c) for c in coords])
+        return {
+            "coords": np.concatenate(coords) if coords else np.zeros(0),
+            "offsets": offsets,
+            "depth1": np.array([polygon["depth1"] for polygon in self.polygons], dtype=np.float64),
+            "depth2": np.array([polygon["depth2"] for polygon in self.polygons], dtype=np.float64),
+            "bounds": np.array(self.bounds, dtype=np.float64),
+            "scale": np.float64(self.scale),
+            "depth_range": np.array([self.min_depth, self.max_depth], dtype=np.float64),
+            "water_wkb": np.frombuffer(shapely.to_wkb(self.water_geometry), dtype=np.uint8),
+        }
+
+    def load_cached_map(self, data):
+        """
+        Restores the processed map from MapCache arrays, no geopandas needed
+        """
+        coords = data["coords"]
+        offsets = data["offsets"]
+        self.polygons = [
+            {"coords": coords[offsets[i]:offsets[i+1]].tolist(),
+             "depth1": float(data["depth1"][i]),
+             "depth2": float(data["depth2"][i])}
+            for i in range(len(offsets) - 1)
+        ]
+        self.bounds = tuple(float(v) for v in data["bounds"])
+        self.scale = float(data["scale"])
+        self.min_depth, self.max_depth = (float(v) for v in data["depth_range"])
+        self.water_geometry = shapely.from_wkb(data["water_wkb"].tobytes())
+        shapely.prepare(self.water_geometry)
+
     def canvas_to_latlon(self, x_canvas, y_canvas):
-        minx, miny, maxx, maxy = self.shp.total_bounds
-        geo_width = maxx - minx
-        geo_height = maxy - miny
-        buffer = 20
-        x_scale = (self.canvas_width - buffer) / geo_width
-        y_scale = (self.canvas_height - buffer) / geo_height
-        scale = min(x_scale, y_scale)
-        x_geo = x_canvas / scale + minx
-        y_geo = maxy - (y_canvas / scale)
+        minx, miny, maxx, maxy = self.bounds
+        x_geo = x_canvas / self.scale + minx
+        y_geo = maxy - (y_canvas / self.scale)
         return x_geo, y_geo
 
+    def water_mask(self, xs, ys):
+        """
+        Returns a uint8 mask [row, col], 1 where the canvas point (xs[col], ys[row])
+        is inside the map, tested in one vectorized pass against the map polygons
+        """
+        if self.water_geometry is None:
+            return np.zeros((len(ys), len(xs)), dtype=np.uint8)
+        x_geo, y_geo = self.canvas_to_latlon(np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64))
+        grid_x, grid_y = np.meshgrid(x_geo, y_geo)
+        # intersects so points on a polygon edge count as water like the canvas hit test did
+        return shapely.intersects_xy(self.water_geometry, grid_x, grid_y).astype(np.uint8)
+
@@ -0,0 +1,106 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# bump when the stored arrays change so old cache files are ignored
+CACHE_VERSION = 1
+SHAPE_PARTS = (".shp", ".shx", ".dbf", ".prj", ".cpg")
+
+
+class MapCache:
+    """
+    On disk cache of processed maps and grids.
+    Files are uncompressed .npz keyed on the shapefile content hash and the canvas
+    size (maps) plus the cell count (grids), so a changed shapefile is a new key.
+    """
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.getcwd(), "cache", "maps")
+        self.cache_dir = Path(cache_dir)
+        self.hashes = dict()  # shapefile path -> content hash for this session
+
+    def shapefile_hash(self, shape_path):
+        """sha256 of the shapefile and its sidecar files"""
+        shape_path = Path(shape_path)
+        key = str(shape_path.resolve())
+        if key in self.hashes:
+            return self.hashes[key]
+        digest = hashlib.sha256()
+        for ext in SHAPE_PARTS:
+            part = shape_path.with_suffix(ext)
+            if part.exists():
+                digest.update(ext.encode())
+                with open(part, "rb") as fh:
+                    for block in iter(lambda: fh.read(1 << 20), b""):
+                        digest.update(block)
+        self.hashes[key] = digest.hexdigest()[:32]
+        return self.hashes[key]
+
+    def map_path(self, shape_hash, canvas_size):
+        return self.cache_dir / f"map_v{CACHE_VERSION}_{shape_hash}_{canvas_size[0]}x{canvas_size[1]}.npz"
+
+    def grid_path(self, shape_hash, canvas_size, cells_n):
+        return self.cache_dir / f"grid_v{CACHE_VERSION}_{shape_hash}_{canvas_size[0]}x{canvas_size[1]}_{cells_n}.npz"
+
+    def load(self, path):
+        """Load a cache file, returns a dict of arrays or None on a miss"""
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return {k: data[k] for k in data.files}
+        except Exception as e:
+            print(f"Ignoring bad map cache file {path}: {e}")
+            return None
+
+    def save(self, path, **arrays):
+        """
+        Write a cache file, failing to write only costs the next startup.
+        Each writer fills its own temp file and renames it over the target,
+        so workers building the same map at once never see a partial file.
+        """
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=path.stem + ".", suffix=".tmp",
+                                             delete=False) as fh:
+                tmp_path = fh.name
+                np.savez(fh, **arrays)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Could not write map cache file {path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def load_map(self, shape_hash, canvas_size):
+        return self.load(self.map_path(shape_hash, canvas_size))
+
+    def save_map(self, shape_hash, canvas_size, **arrays):
+        self.save(self.map_path(shape_hash, canvas_size), **arrays)
+
+    def load_grid(self, shape_hash, canvas_size, cells_n):
+        return self.load(self.grid_path(shape_hash, canvas_size, cells_n))
+
+    def save_grid(self, shape_hash, canvas_size, cells_n, **arrays):
+        self.save(self.grid_path(shape_hash, canvas_size, cells_n), **arrays)
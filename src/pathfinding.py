@@ -0,0 +1,223 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import heapq
+import logging
+import math
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+log = logging.getLogger(__name__)
+
+SQRT2 = math.sqrt(2.0)
+# (row, col, cost) moves, orthogonal first so ties prefer straight moves
+NEIGHBOUR_OFFSETS = (
+    (0, 1, 1.0), (0, -1, 1.0), (1, 0, 1.0), (-1, 0, 1.0),
+    (1, 1, SQRT2), (1, -1, SQRT2), (-1, 1, SQRT2), (-1, -1, SQRT2),
+)
+
+
+class PathEngine:
+    """
+    A* over the grid water mask, shared by every agent on that grid.
+    Cells are flat indexes row * COL + col. Only the sparse adjacency the
+    FlowField needs is built up front, the per cell neighbour lists and the
+    search tables are made on the first search. The g score, parent and
+    closed tables are reset between searches by bumping a generation stamp
+    instead of clearing them.
+    """
+    def __init__(self, water):
+        water = np.asarray(water).astype(bool)
+        self.ROW, self.COL = water.shape
+        self.size = self.ROW * self.COL
+        self.water = water.ravel()
+        self.adjacency = self.build_adjacency(water)  # sparse (cell, cell) move costs
+        self.neighbours = None  # per cell (neighbour, cost) lists, built by prepare_search
+
+    def moves(self, water):
+        """(source cells, destination cells, cost) for each offset, water to water only"""
+        rows, cols = np.indices(water.shape)
+        flat = rows * self.COL + cols
+        for dr, dc, cost in NEIGHBOUR_OFFSETS:
+            nr = rows + dr
+            nc = cols + dc
+            ok = (nr >= 0) & (nr < self.ROW) & (nc >= 0) & (nc < self.COL) & water
+            ok[ok] = water[nr[ok], nc[ok]]
+            yield flat[ok], nr[ok] * self.COL + nc[ok], cost
+
+    def build_adjacency(self, water):
+        """Sparse matrix of move costs, the graph FlowField runs Dijkstra over"""
+        srcs, dsts, costs = [], [], []
+        for src, dst, cost in self.moves(water):
+            srcs.append(src)
+            dsts.append(dst)
+            costs.append(np.full(src.size, cost))
+        return csr_matrix((np.concatenate(costs), (np.concatenate(srcs), np.concatenate(dsts))),
+                          shape=(self.size, self.size))
+
+    def prepare_search(self):
+        """Neighbour lists and search tables, plain lists are far quicker than numpy for single items"""
+        table = [[] for _ in range(self.size)]
+        for src, dst, cost in self.moves(self.water.reshape(self.ROW, self.COL)):
+            for a, b in zip(src.tolist(), dst.tolist()):
+                table[a].append((b, cost))
+        self.neighbours = table
+        self.g = [0.0] * self.size
+        self.parent = [-1] * self.size
+        self.seen_gen = [0] * self.size    # g and parent are valid for this search
+        self.closed_gen = [0] * self.size  # cell was expanded in this search
+        self.generation = 0
+
+    def is_valid(self, row, col):
+        """Check if a cell is in the bounds"""
+        return 0 <= row < self.ROW and 0 <= col < self.COL
+
+    def is_unblocked(self, row, col):
+        """Check if a cell is water"""
+        return bool(self.water[row * self.COL + col])
+
+    def search(self, start, goal):
+        """
+        A* from start to goal, both (row, col).
+        Returns the list of (row, col) cells from start to goal, or None if
+        either end is off the grid or on land, the start is the goal, or the
+        goal can't be reached.
+        """
+        s_row, s_col = int(start[0]), int(start[1])
+        g_row, g_col = int(goal[0]), int(goal[1])
+        if not self.is_valid(s_row, s_col) or not self.is_valid(g_row, g_col):
+            log.debug("Source or destination is invalid")
+            return None
+        if not self.is_unblocked(s_row, s_col) or not self.is_unblocked(g_row, g_col):
+            log.debug("Source or the destination is blocked")
+            return None
+        if (s_row, s_col) == (g_row, g_col):
+            return None
+        if self.neighbours is None:
+            self.prepare_search()
+
+        self.generation += 1
+        gen = self.generation
+        g = self.g
+        parent = self.parent
+        seen_gen = self.seen_gen
+        closed_gen = self.closed_gen
+        neighbours = self.neighbours
+        COL = self.COL
+        octile = SQRT2 - 2.0
+
+        start_i = s_row * COL + s_col
+        goal_i = g_row * COL + g_col
+        g[start_i] = 0.0
+        parent[start_i] = start_i
+        seen_gen[start_i] = gen
+
+        open_list = [(0.0, start_i)]
+        while open_list:
+            _, cur = heapq.heappop(open_list)
+            if closed_gen[cur] == gen:
+                continue  # stale heap entry
+            if cur == goal_i:
+                return self.trace_path(goal_i)
+            closed_gen[cur] = gen
+            g_cur = g[cur]
+            for nb, cost in neighbours[cur]:
+                if closed_gen[nb] == gen:
+                    continue
+                g_new = g_cur + cost
+                if seen_gen[nb] != gen or g_new < g[nb]:
+                    seen_gen[nb] = gen
+                    g[nb] = g_new
+                    parent[nb] = cur
+                    # octile distance, exact on an empty 8 connected grid
+                    dr = abs(nb // COL - g_row)
+                    dc = abs(nb % COL - g_col)
+                    h = dr + dc + octile * (dr if dr < dc else dc)
+                    heapq.heappush(open_list, (g_new + h, nb))
+
+        log.debug("Failed to find the destination cell")
+        return None
+
+    def trace_path(self, goal_i):
+        """Walk the parents back from the goal, returns start to goal (row, col) cells"""
+        path = []
+        cur = goal_i
+        while True:
+            path.append(divmod(cur, self.COL))
+            if self.parent[cur] == cur:
+                break
+            cur = self.parent[cur]
+        path.reverse()
+        return path
+
+
+class FlowField:
+    """
+    Water distance and next move toward the nearest of many sources.
+    One reverse Dijkstra from every source at once, after that any cell can
+    read its next cell and distance in O(1). Rebuild when the sources change.
+    """
+    def __init__(self, grid):
+        self.grid = grid
+        self.sources = tuple()
+        self.dist = list()       # flat cell -> moves cost to the nearest source, inf if cut off
+        self.next_cell = list()  # flat cell -> next flat cell toward that source, -1 if none
+        self.next_cells = np.empty(0, dtype=np.int32)  # next_cell as an array for bulk lookups
+        self.grid_version = None
+        self.builds = 0
+
+    def build(self, sources):
+        """Rebuild from a list of (row, col) source cells, land and off grid cells are skipped"""
+        engine = self.grid.path_engine
+        COL = engine.COL
+        flat = sorted({int(r) * COL + int(c) for r, c in sources
+                       if engine.is_valid(int(r), int(c)) and engine.is_unblocked(int(r), int(c))})
+        self.sources = tuple(divmod(i, COL) for i in flat)
+        self.grid_version = self.grid.version
+        self.builds += 1
+        if not flat:
+            self.dist = [math.inf] * engine.size
+            self.next_cell = [-1] * engine.size
+            self.next_cells = np.full(engine.size, -1, dtype=np.int32)
+            return
+        # moves are symmetric so the tree grown from the sources points back at them
+        dist, predecessors, _ = dijkstra(engine.adjacency, indices=flat, min_only=True,
+                                         return_predecessors=True)
+        predecessors[predecessors < 0] = -1
+        predecessors[flat] = flat  # sources stay put
+        self.dist = dist.tolist()
+        self.next_cell = predecessors.tolist()
+        self.next_cells = predecessors.astype(np.int32)
+
+    def is_stale(self):
+        """True if the grid water mask changed since the last build"""
+        return self.grid_version != self.grid.version
+
+    def next_step(self, row, col):
+        """Next (row, col) toward the nearest source, the cell itself on a source, None if unreachable"""
+        COL = self.grid.path_engine.COL
+        nxt = self.next_cell[row * COL + col]
+        if nxt < 0:
+            return None
+        return divmod(nxt, COL)
+
+    def distance(self, row, col):
+        """Water distance to the nearest source in cells, inf if unreachable"""
+        return self.dist[row * self.grid.path_engine.COL + col]
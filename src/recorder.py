@@ -0,0 +1,191 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnTable:
+    """
+    Append only table stored as preallocated numpy column chunks.
+    A block appended in one call always lands in a single chunk, so it can be
+    read back as views. Full chunks are sealed, and with a spill_dir they are
+    written to disk and dropped from memory.
+    """
+    def __init__(self, dtypes, chunk_rows=65536, spill_dir=None, name="table"):
+        self.dtypes = dict(dtypes)  # column -> numpy dtype
+        self.chunk_rows = chunk_rows
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.name = name
+        self.chunks = list()  # sealed chunks, a dict of arrays or the Path it was spilled to
+        self.current = None
+        self.capacity = 0
+        self.fill = 0
+        self.rows = 0
+
+    def new_chunk(self, min_rows):
+        rows = max(self.chunk_rows, min_rows)
+        self.current = {name: np.empty(rows, dtype=dtype) for name, dtype in self.dtypes.items()}
+        self.capacity = rows
+        self.fill = 0
+
+    def seal(self):
+        """Close the current chunk, spilling it to disk if asked"""
+        if self.current is None or self.fill == 0:
+            return
+        chunk = {name: col[:self.fill].copy() for name, col in self.current.items()}
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            path = self.spill_dir / f"{self.name}_{len(self.chunks):05d}.npz"
+            np.savez(path, **chunk)
+            self.chunks.append(path)
+        else:
+            self.chunks.append(chunk)
+        self.current = None
+        self.fill = 0
+
+    def append(self, columns, n):
+        """Append n rows, columns is name -> sequence of n values. Returns the (start, stop) of the block in the current chunk"""
+        if self.current is None or self.fill + n > self.capacity:
+            self.seal()
+            self.new_chunk(n)
+        start = self.fill
+        stop = start + n
+        for name, col in self.current.items():
+            col[start:stop] = columns[name]
+        self.fill = stop
+        self.rows += n
+        return start, stop
+
+    def view(self, start, stop):
+        """Read only views of rows [start, stop) of the current chunk"""
+        block = dict()
+        for name, col in self.current.items():
+            v = col[start:stop]
+            v.flags.writeable = False
+            block[name] = v
+        return block
+
+    def load_chunk(self, chunk):
+        if isinstance(chunk, Path):
+            with np.load(chunk, allow_pickle=False) as data:
+                return {name: data[name] for name in self.dtypes}
+        return chunk
+
+    def column(self, name):
+        """Whole column, spilled chunks are read back from disk"""
+        parts = [self.load_chunk(chunk)[name] for chunk in self.chunks]
+        if self.current is not None:
+            parts.append(self.current[name][:self.fill])
+        if not parts:
+            return np.empty(0, dtype=self.dtypes[name])
+        return np.concatenate(parts)
+
+    def to_dataframe(self):
+        return pd.DataFrame({name: self.column(name) for name in self.dtypes})
+
+
+def claim_run_dir(spill_dir):
+    """Make and return the first free run_NNNN folder in spill_dir, so runs never share spill files"""
+    spill_dir = Path(spill_dir)
+    spill_dir.mkdir(parents=True, exist_ok=True)
+    n = 0
+    while True:
+        run_dir = spill_dir / f"run_{n:04d}"
+        try:
+            run_dir.mkdir()
+            return run_dir
+        except FileExistsError:
+            n += 1
+
+
+class StepRecorder:
+    """
+    Per step agent and model records for UUVModel, replaces mesa's DataCollector.
+    collect() costs the same at step 10 and step 10000, and latest() gives the
+    newest step without building any DataFrame. With a spill_dir every
+    recorder spills into a run folder of its own inside it.
+    """
+    AGENT_COLUMNS = {
+        "step": np.int64,
+        "agent_id": np.int64,
+        "kind": np.int16,      # index into kinds, -1 if unknown
+        "x": np.float64,
+        "y": np.float64,
+        "status": np.int8,
+        "finished": np.int8,   # SearchAgent.is_finnished
+        "complete": np.int8,   # UUVAgent.is_complete
+    }
+    MODEL_COLUMNS = {
+        "step": np.int64,
+        "total_agents": np.int64,
+    }
+
+    def __init__(self, agent_map, chunk_rows=65536, spill_dir=None):
+        """agent_map is the model AGENT_MAP, name -> class"""
+        self.kinds = list(agent_map.keys())
+        self.kind_codes = {agent_class: i for i, agent_class in enumerate(agent_map.values())}
+        # reset_sim makes a new recorder on the same spill_dir, keep its chunks apart
+        self.run_dir = claim_run_dir(spill_dir) if spill_dir is not None else None
+        self.agent_table = ColumnTable(self.AGENT_COLUMNS, chunk_rows, self.run_dir, name="agents")
+        self.model_table = ColumnTable(self.MODEL_COLUMNS, max(1, chunk_rows // 64), self.run_dir, name="model")
+        self.latest_step = None
+        self.latest_range = (0, 0)
+
+    def collect(self, model):
+        agents = list(model.agents)
+        n = len(agents)
+        positions = [self.agent_position(a) for a in agents]
+        columns = {
+            "step": np.full(n, model.steps, dtype=np.int64),
+            "agent_id": [a.unique_id for a in agents],
+            "kind": [self.kind_codes.get(type(a), -1) for a in agents],
+            "x": [p[0] if p is not None else math.nan for p in positions],
+            "y": [p[1] if p is not None else math.nan for p in positions],
+            "status": [bool(getattr(a, "status", True)) for a in agents],
+            "finished": [bool(getattr(a, "is_finnished", False)) for a in agents],
+            "complete": [bool(getattr(a, "is_complete", False)) for a in agents],
+        }
+        self.latest_range = self.agent_table.append(columns, n)
+        self.model_table.append({"step": [model.steps], "total_agents": [n]}, 1)
+        self.latest_step = model.steps
+
+    @staticmethod
+    def agent_position(agent):
+        position = getattr(agent, "position", None)
+        if position is None:
+            position = getattr(agent, "pos_pixel", None)
+        return position
+
+    def latest(self):
+        """Read only column views of the newest collected step, None before the first collect"""
+        if self.latest_step is None:
+            return None
+        return self.agent_table.view(*self.latest_range)
+
+    def get_agent_vars_dataframe(self):
+        """Whole agent history indexed by (step, agent_id) like DataCollector"""
+        df = self.agent_table.to_dataframe()
+        df["kind"] = [self.kinds[k] if k >= 0 else None for k in df["kind"]]
+        return df.set_index(["step", "agent_id"])
+
+    def get_model_vars_dataframe(self):
+        return self.model_table.to_dataframe().set_index("step")
@@ -0,0 +1,261 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+from PIL import Image
+
+
+class SpriteCache:
+    """
+    Process wide cache of resized agent icons keyed by (path, size, state).
+    Each file is decoded and resized once, every agent and spawn marker
+    showing it shares the same PhotoImage. Files that fail to load are
+    remembered too so the error is only printed once.
+    """
+    def __init__(self):
+        self.images = dict()  # (path, size, state) -> resized PIL image, None if it failed
+        self.photos = dict()  # (path, size, state) -> ImageTk.PhotoImage
+        self.loads = 0
+
+    def image(self, path, size, state="alive"):
+        """Resized PIL image, None if it can't be loaded"""
+        key = (path, tuple(size), state)
+        if key not in self.images:
+            self.loads += 1
+            try:
+                img = Image.open(path)
+                self.images[key] = img.resize(tuple(size), Image.Resampling.LANCZOS)
+            except Exception as e:
+                print("Error loading agent icon:", e)
+                self.images[key] = None
+        return self.images[key]
+
+    def get(self, path, size, state="alive"):
+        """Shared PhotoImage for the sprite, None without a path, tkinter or a loadable file"""
+        if path is None:
+            return None
+        key = (path, tuple(size), state)
+        photo = self.photos.get(key)
+        if photo is None:
+            # ImageTk pulls in tkinter, only import it once a sprite is drawn
+            try:
+                from PIL import ImageTk
+            except ImportError:
+                return None
+            img = self.image(path, size, state)
+            if img is None:
+                return None
+            photo = ImageTk.PhotoImage(img)
+            self.photos[key] = photo
+        return photo
+
+    def clear(self):
+        self.images.clear()
+        self.photos.clear()
+
+
+# one cache for the whole process, PhotoImages belong to the single tk root
+SPRITES = SpriteCache()
+
+
+class Renderer:
+    """
+    Base renderer, every hook is a no-op.
+    The model and agents only ever talk to a renderer, never to tkinter,
+    so a model without any renderer subscribed runs fully headless.
+    """
+    def agent_added(self, agent):
+        """Called once an agent is fully built"""
+
+    def agent_moved(self, agent):
+        """Called after the agent position changed"""
+
+    def agent_changed(self, agent, state):
+        """Called when the agent changes state ie "destroyed" or "finished" """
+
+    def agent_removed(self, agent):
+        """Called when the agent is removed or cleaned up"""
+
+    def clear(self):
+        """Remove everything this renderer has drawn"""
+
+
+class RenderHub(Renderer):
+    """
+    Forwards every render call to the subscribed renderers.
+    Between hold() and flush() moves are only remembered, flush() then sends
+    one move per agent with its final position. Used to run many steps in a
+    frame and draw only the last one.
+    """
+    def __init__(self):
+        self.subscribers = []
+        self.held = None  # unique_id -> agent moved while held, None when not holding
+
+    def hold(self):
+        """Start collecting moves instead of drawing them"""
+        if self.held is None:
+            self.held = dict()
+
+    def flush(self):
+        """Stop holding and draw every agent that moved since hold()"""
+        held, self.held = self.held, None
+        if held:
+            for agent in held.values():
+                self.agent_moved(agent)
+
+    @property
+    def active(self):
+        """True if anything is listening"""
+        return len(self.subscribers) > 0
+
+    def subscribe(self, renderer):
+        """Add a renderer to the hub"""
+        if renderer not in self.subscribers:
+            self.subscribers.append(renderer)
+
+    def unsubscribe(self, renderer):
+        """Remove a renderer from the hub"""
+        if renderer in self.subscribers:
+            self.subscribers.remove(renderer)
+
+    def agent_added(self, agent):
+        for renderer in self.subscribers:
+            renderer.agent_added(agent)
+
+    def agent_moved(self, agent):
+        if self.held is not None:
+            self.held[agent.unique_id] = agent
+            return
+        for renderer in self.subscribers:
+            renderer.agent_moved(agent)
+
+    def agent_changed(self, agent, state):
+        for renderer in self.subscribers:
+            renderer.agent_changed(agent, state)
+
+    def agent_removed(self, agent):
+        if self.held is not None:
+            self.held.pop(agent.unique_id, None)
+        for renderer in self.subscribers:
+            renderer.agent_removed(agent)
+
+    def clear(self):
+        if self.held is not None:
+            self.held.clear()
+        for renderer in self.subscribers:
+            renderer.clear()
+
+
+class CanvasRenderer(Renderer):
+    """Draws the agents on the tkinter canvas"""
+    ICON_SIZE = (20, 20)
+    OVAL_RADIUS = 5
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        # agent unique_id -> {"sprite": id, "radius": id, "icon": shared PhotoImage}
+        self.items = dict()
+
+    def load_icon(self, path, state="alive"):
+        """Shared resized sprite from the sprite cache, returns None if it can't"""
+        return SPRITES.get(path, self.ICON_SIZE, state)
+
+    def agent_position(self, agent):
+        """Pixel position of the agent"""
+        position = getattr(agent, "position", None)
+        if position is None:
+            position = getattr(agent, "pos_pixel", None)
+        return position
+
+    def agent_added(self, agent):
+        position = self.agent_position(agent)
+        if position is None:
+            return
+        x, y = position[0], position[1]
+        tag = getattr(agent, "RENDER_TAG", "agent")
+        color = getattr(agent, "color", None) or getattr(agent, "DEFAULT_COLOR", "red")
+        r = self.OVAL_RADIUS
+        items = {"sprite": None, "radius": None, "icon": None}
+
+        icon = self.load_icon(getattr(agent, "SPRITE_PATH", None))
+        if icon is not None:
+            items["icon"] = icon
+            items["sprite"] = self.canvas.create_image(x, y, image=icon, tags=tag)
+        else:
+            # fallback: draw oval if there is no icon
+            items["sprite"] = self.canvas.create_oval(x-r, y-r, x+r, y+r, fill=color, tags=tag)
+        self.canvas.lift(items["sprite"])
+
+        # detectors show their detection range
+        if getattr(agent, "SHOW_RADIUS", False):
+            radius = agent.radius
+            items["radius"] = self.canvas.create_oval(
+                x - radius, y - radius,
+                x + radius, y + radius,
+                outline=getattr(agent, "radius_color", "white"), fill='', dash=(3, 3), tags=tag
+            )
+            self.canvas.lift(items["radius"])
+
+        self.items[agent.unique_id] = items
+
+    def agent_moved(self, agent):
+        items = self.items.get(agent.unique_id)
+        position = self.agent_position(agent)
+        if items is None or position is None:
+            return
+        x, y = position[0], position[1]
+        if items["icon"] is not None:
+            self.canvas.coords(items["sprite"], x, y)
+        else:
+            r = self.OVAL_RADIUS
+            self.canvas.coords(items["sprite"], x-r, y-r, x+r, y+r)
+
+    def agent_changed(self, agent, state):
+        items = self.items.get(agent.unique_id)
+        if items is None:
+            return
+        try:
+            if state == "destroyed":
+                icon = self.load_icon(getattr(agent, "DESTROYED_SPRITE_PATH", None), "destroyed")
+                if icon is not None and items["icon"] is not None:
+                    items["icon"] = icon
+                    self.canvas.itemconfig(items["sprite"], image=icon)
+                elif items["icon"] is None:
+                    self.canvas.itemconfig(items["sprite"], fill="#7C0000")
+            elif state == "finished" and items["icon"] is None:
+                self.canvas.itemconfig(items["sprite"], fill="black")
+        except Exception:
+            pass
+
+    def agent_removed(self, agent):
+        items = self.items.pop(agent.unique_id, None)
+        if items is not None:
+            self.delete_items(items)
+
+    def clear(self):
+        for items in self.items.values():
+            self.delete_items(items)
+        self.items.clear()
+
+    def delete_items(self, items):
+        """Delete the canvas items drawn for one agent"""
+        for key in ("sprite", "radius"):
+            if items[key] is not None:
+                try:
+                    self.canvas.delete(items[key])
+                except Exception:
+                    pass
@@ -0,0 +1,90 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+
+class ActiveScheduler:
+    """
+    Steps only the agents that still have something to do.
+    Agents are bucketed by kind and each bucket is stepped in the fixed phase
+    order, in creation order inside a bucket. Inert agents (used detectors,
+    dead attackers, finished GA agents...) are deactivated by the model and
+    cost nothing until an event activates them again. Kinds that are not in
+    phases are never stepped. A kind with a batch step is handed to it as one
+    list instead of stepping its agents one by one.
+    """
+    def __init__(self, phases):
+        self.phases = tuple(phases)
+        self.active = {kind: dict() for kind in self.phases}  # kind -> unique_id -> agent
+        self.kind_of = dict()  # unique_id -> kind, for every known agent
+        self.batch_steps = dict()  # kind -> callable taking the list of active agents
+
+    def set_batch_step(self, kind, step):
+        """Step every active agent of kind with one call to step(agents)"""
+        self.batch_steps[kind] = step
+
+    def add(self, kind, agent, active=True):
+        """Track a new agent, it is first stepped on the next step()"""
+        self.kind_of[agent.unique_id] = kind
+        if active:
+            self.activate(agent)
+
+    def remove(self, agent):
+        kind = self.kind_of.pop(agent.unique_id, None)
+        if kind in self.active:
+            self.active[kind].pop(agent.unique_id, None)
+
+    def activate(self, agent):
+        kind = self.kind_of.get(agent.unique_id)
+        if kind in self.active:
+            self.active[kind][agent.unique_id] = agent
+
+    def deactivate(self, agent):
+        kind = self.kind_of.get(agent.unique_id)
+        if kind in self.active:
+            self.active[kind].pop(agent.unique_id, None)
+
+    def is_active(self, agent):
+        kind = self.kind_of.get(agent.unique_id)
+        return kind in self.active and agent.unique_id in self.active[kind]
+
+    def clear(self):
+        for bucket in self.active.values():
+            bucket.clear()
+        self.kind_of.clear()
+
+    def count(self, kind=None):
+        """Active agents of one kind, or of every kind"""
+        if kind is None:
+            return sum(len(bucket) for bucket in self.active.values())
+        return len(self.active.get(kind, ()))
+
+    def step(self):
+        """Step every active agent, phase by phase"""
+        # snapshot first so agents created during this step wait for the next one, like AgentSet.do
+        batches = [list(self.active[kind].values()) for kind in self.phases]
+        for kind, batch in zip(self.phases, batches):
+            bucket = self.active[kind]
+            if kind in self.batch_steps:
+                batch = [agent for agent in batch if agent.unique_id in bucket]
+                if batch:
+                    self.batch_steps[kind](batch)
+                continue
+            for agent in batch:
+                # an earlier agent this step may have made it inert
+                if agent.unique_id in bucket:
+                    agent.step()
@@ -0,0 +1,108 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import numpy as np
+
+
+class RayleighTable:
+    """
+    exp(-d^2 / (2 sigma^2)) sampled every resolution pixels up to max_distance.
+    Lookups round to the nearest sample, past the end they read the last one.
+    """
+    def __init__(self, sigma, max_distance, resolution=0.01):
+        self.sigma = sigma
+        self.resolution = resolution
+        distance = np.arange(0.0, max_distance + resolution, resolution)
+        self.table = np.exp(-(distance ** 2) / (2 * sigma ** 2))
+
+    def __call__(self, distance):
+        index = np.rint(np.asarray(distance) / self.resolution).astype(int)
+        return self.table[np.minimum(index, len(self.table) - 1)]
+
+
+class SensingPhase:
+    """
+    Detection for every detector in one pass, owned by the model.
+    Seekers in range come from the spatial index in bulk, the Rayleigh
+    probabilities from a lookup table and all the Bernoulli trials from one
+    draw on the model rng. A detector fires on the first seeker in creation
+    order whose trial succeeds, the same rule DetectorAgent.detect used.
+    """
+    def __init__(self, model, kind="seeker"):
+        self.model = model
+        self.kind = kind
+        self.tables = dict()  # (sigma, radius) -> RayleighTable
+
+    def table(self, sigma, radius):
+        key = (sigma, radius)
+        if key not in self.tables:
+            self.tables[key] = RayleighTable(sigma, radius)
+        return self.tables[key]
+
+    def sense(self, detectors):
+        """Run one step of sensing for the detectors, returns the (detector, agent) detections"""
+        spatial = self.model.spatial
+        detectors = [d for d in detectors if not d.Used]
+        if not detectors or self.kind not in spatial.trees:
+            return []
+        tree = spatial.trees[self.kind]
+        agents = spatial.agents[self.kind]
+        ids = np.array([a.unique_id for a in agents])
+        status = np.array([bool(getattr(a, 'status', True)) for a in agents])
+
+        points = np.array([[d.position[0], d.position[1]] for d in detectors], dtype=float)
+        radii = np.array([d.radius for d in detectors], dtype=float)
+        hits = tree.query_ball_point(points, radii)
+
+        # flatten to (detector, agent) pairs, agents in creation order per detector
+        det_idx, agent_idx = list(), list()
+        for n, near in enumerate(hits):
+            near = [i for i in near if status[i]]
+            near.sort(key=lambda i: ids[i])
+            det_idx.extend([n] * len(near))
+            agent_idx.extend(near)
+        if not agent_idx:
+            return []
+        det_idx = np.array(det_idx)
+        agent_idx = np.array(agent_idx)
+
+        dist = np.hypot(*(tree.data[agent_idx] - points[det_idx]).T)
+        prob = np.empty(len(dist))
+        keys = [(d.sigma, d.radius) for d in detectors]
+        for key in set(keys):
+            mine = np.isin(det_idx, [n for n, k in enumerate(keys) if k == key])
+            prob[mine] = self.table(*key)(dist[mine])
+        success = self.model.rng.random(len(dist)) < prob
+
+        # pairs are grouped by detector, [first[n], stop[n]) are detector n's
+        first = np.searchsorted(det_idx, np.arange(len(detectors)), side="left").tolist()
+        stop = np.searchsorted(det_idx, np.arange(len(detectors)), side="right").tolist()
+        detections = list()
+        for n, d in enumerate(detectors):
+            if first[n] == stop[n]:
+                continue
+            fired = first[n] + np.flatnonzero(success[first[n]:stop[n]])
+            # log the trials up to the one that fired, later ones never happened
+            last = int(fired[0]) + 1 if fired.size else stop[n]
+            d.prob_log.extend(zip(dist[first[n]:last].tolist(), prob[first[n]:last].tolist()))
+            if fired.size:
+                i = int(fired[0])
+                agent = agents[agent_idx[i]]
+                if d.detected(agent, float(dist[i]), float(prob[i])):
+                    detections.append((d, agent))
+        return detections
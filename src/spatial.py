@@ -0,0 +1,159 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import math
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+def segment_distance(starts, ends, points):
+    """
+    Closest distance from each point to the segment start -> end, all (n, 2).
+    A zero length segment is just the distance to start.
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    seg = ends - starts
+    length2 = np.einsum("ij,ij->i", seg, seg)
+    t = np.einsum("ij,ij->i", points - starts, seg)
+    t = np.divide(t, length2, out=np.zeros_like(t), where=length2 > 0)
+    closest = starts + seg * np.clip(t, 0.0, 1.0)[:, None]
+    return np.hypot(*(points - closest).T)
+
+
+class SpatialIndex:
+    """
+    Per step snapshot of live agent positions, one cKDTree per agent kind.
+    Kinds are the AGENT_MAP names ("seeker", "target", ...). Queries take a kind
+    or a tuple of kinds and return agents in creation order, so callers that
+    used to loop over model.agents see the same order.
+    Agents with a prev_position also keep the segment they moved along this
+    step for the swept queries.
+    """
+    def __init__(self):
+        self.trees = dict()   # kind -> cKDTree
+        self.agents = dict()  # kind -> agents in the same order as the tree points
+        self.prev = dict()    # kind -> (n, 2) positions at the start of the step
+        self.sweep = dict()   # kind -> longest move this step
+        self.step = None
+
+    def rebuild(self, groups, step=None):
+        """groups is kind -> list of agents that have a position"""
+        self.trees.clear()
+        self.agents.clear()
+        self.prev.clear()
+        self.sweep.clear()
+        for kind, agents in groups.items():
+            if not agents:
+                continue
+            points = np.array([[a.position[0], a.position[1]] for a in agents], dtype=float)
+            prev = np.array([self.prev_position(a) for a in agents], dtype=float)
+            self.trees[kind] = cKDTree(points)
+            self.agents[kind] = list(agents)
+            self.prev[kind] = prev
+            self.sweep[kind] = float(np.hypot(*(points - prev).T).max())
+        self.step = step
+
+    @staticmethod
+    def prev_position(agent):
+        prev = getattr(agent, "prev_position", None)
+        if prev is None:
+            prev = agent.position
+        return (prev[0], prev[1])
+
+    def kinds(self, kind):
+        """Normalise a kind or tuple of kinds to the kinds that have a tree"""
+        if isinstance(kind, str):
+            kind = (kind,)
+        return [k for k in kind if k in self.trees]
+
+    def count(self, kind):
+        return sum(len(self.agents[k]) for k in self.kinds(kind))
+
+    def query_radius(self, kind, point, radius, strict=False):
+        """
+        Agents of kind within radius of point as (agent, distance) pairs.
+        strict=True keeps only distance < radius instead of <=.
+        """
+        found = list()
+        x, y = float(point[0]), float(point[1])
+        for k in self.kinds(kind):
+            agents = self.agents[k]
+            tree = self.trees[k]
+            for i in tree.query_ball_point((x, y), radius):
+                px, py = tree.data[i]
+                dist = math.hypot(px - x, py - y)
+                if strict and dist >= radius:
+                    continue
+                found.append((agents[i], dist))
+        found.sort(key=lambda pair: pair[0].unique_id)
+        return found
+
+    def query_radius_many(self, kind, points, radius, strict=False):
+        """query_radius for an (n, 2) array of points in one tree call per kind"""
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        found = [list() for _ in range(len(points))]
+        for k in self.kinds(kind):
+            agents = self.agents[k]
+            tree = self.trees[k]
+            for n, hits in enumerate(tree.query_ball_point(points, radius)):
+                for i in hits:
+                    dist = float(np.hypot(*(tree.data[i] - points[n])))
+                    if strict and dist >= radius:
+                        continue
+                    found[n].append((agents[i], dist))
+        for hits in found:
+            hits.sort(key=lambda pair: pair[0].unique_id)
+        return found
+
+    def query_swept_many(self, kind, points, radius, strict=False):
+        """
+        query_radius_many against the path each agent moved along this step
+        instead of where it ended up, so a fast agent can't pass through a
+        point between two steps. Distances are the closest approach.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        found = [list() for _ in range(len(points))]
+        for k in self.kinds(kind):
+            agents = self.agents[k]
+            tree = self.trees[k]
+            # anything that came within radius ends the step within radius + its move
+            hits = tree.query_ball_point(points, radius + self.sweep[k])
+            pairs = [(n, i) for n, near in enumerate(hits) for i in near]
+            if not pairs:
+                continue
+            n_idx, a_idx = np.array(pairs).T
+            dist = segment_distance(self.prev[k][a_idx], tree.data[a_idx], points[n_idx])
+            keep = dist < radius if strict else dist <= radius
+            for n, i, d in zip(n_idx[keep].tolist(), a_idx[keep].tolist(), dist[keep].tolist()):
+                found[n].append((agents[i], d))
+        for hits in found:
+            hits.sort(key=lambda pair: pair[0].unique_id)
+        return found
+
+    def nearest(self, kind, point, max_distance=math.inf):
+        """Closest agent of kind to point as (agent, distance), (None, inf) if none"""
+        best = (None, math.inf)
+        for k in self.kinds(kind):
+            dist, i = self.trees[k].query((float(point[0]), float(point[1])), k=1,
+                                          distance_upper_bound=max_distance)
+            if dist < best[1]:
+                best = (self.agents[k][i], float(dist))
+        return best
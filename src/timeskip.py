@@ -0,0 +1,173 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import math
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from pathfinding import SQRT2
+
+
+class IdleSkipper:
+    """
+    Event driven time advance for UUVModel.
+    Before a full step it works out how many of the coming steps can't
+    detect, collide or need an agent to decide anything, from the distances
+    to the detector radii and collision thresholds and the fastest possible
+    closing speed. Those steps only run the kinematics: seekers reaching a
+    cell take the next one from the target flow field like their step would,
+    and the first seeker with no water route ends the skip early.
+    Skipped steps are not recorded.
+    """
+    def __init__(self, model, max_skip=1000):
+        self.model = model
+        self.max_skip = max_skip
+        self.skipped = 0  # steps skipped over the whole run
+        self.skips = 0    # times a skip happened
+
+    @staticmethod
+    def steps_before(gap, rate):
+        """Whole steps that keep a gap closing at rate per step above zero"""
+        if rate <= 0:
+            return math.inf
+        return max(0, math.ceil(gap / rate) - 1)
+
+    def horizon(self, seekers):
+        """Steps that can be skipped before the next full step, 0 if something may happen right away"""
+        model = self.model
+        scheduler = model.scheduler
+        kinematics = model.kinematics
+
+        # GA agents and agents we don't know decide something every step
+        if model.ga_model_active or model.counts["GA"]["live"] > 0 or scheduler.count("other"):
+            return 0
+        if any(not s.on_field for s in seekers):
+            return 0
+
+        limit = self.max_skip
+        if model.max_steps is not None:
+            limit = min(limit, model.max_steps - model.steps - 1)
+        if limit <= 0:
+            return 0
+
+        radius = model.COLLISION_RADIUS
+        if seekers:
+            slots = np.array([s.slot for s in seekers])
+            points = kinematics.pos[slots].astype(float)
+            # fastest a seeker can cover in a step is one diagonal move at its speed
+            rate = float(kinematics.speed[slots].max()) * SQRT2
+
+            if len(model.target_positions):
+                dist, _ = cKDTree(model.target_positions).query(points, k=1)
+                limit = min(limit, self.steps_before(float(dist.min()) - radius, rate))
+
+            detectors = [d for d in scheduler.active["detector"].values() if not d.Used]
+            if detectors and limit > 0:
+                sensors = np.array([[d.position[0], d.position[1]] for d in detectors], dtype=float)
+                dist, _ = cKDTree(sensors).query(points, k=1)
+                reach = max(d.radius for d in detectors)
+                limit = min(limit, self.steps_before(float(dist.min()) - reach, rate))
+
+        for cuuv in scheduler.active["CUUV"].values():
+            if limit <= 0:
+                break
+            target = cuuv.target
+            if not kinematics.moving[cuuv.slot]:
+                return 0  # launched this step, its first step starts the chase
+            if target is None or not getattr(target, "status", False) or getattr(target, "slot", None) is None:
+                return 0  # the CUUV step has to clear or re-aim it
+            gap = float(np.hypot(*(cuuv.position - target.position))) - radius
+            rate = cuuv.speed + float(kinematics.speed[target.slot]) * SQRT2
+            limit = min(limit, self.steps_before(gap, rate))
+        return max(0, limit)
+
+    def skip(self):
+        """Run the idle steps ahead of the next full step, returns how many were skipped"""
+        model = self.model
+        # only rebuilds if a target came or went since the last step
+        field = model.get_target_field()
+        if field is None:
+            return 0
+        seekers = list(model.scheduler.active["seeker"].values())
+        n = self.horizon(seekers)
+        if n <= 0:
+            return 0
+
+        kinematics = model.kinematics
+        moving = kinematics.moving[:kinematics.size]
+        if not moving.any():
+            # nothing moves, only the clock does
+            done = n
+        else:
+            done = self.advance(seekers, field, n)
+        if done == 0:
+            return 0
+
+        model.steps += done
+        self.skipped += done
+        self.skips += 1
+        model.update_spatial_index()
+        return done
+
+    def advance(self, seekers, field, n):
+        """Move the kinematics through up to n steps, returns the steps done"""
+        model = self.model
+        grid = model.grid
+        kinematics = model.kinematics
+        COL = grid.path_engine.COL
+        next_cell = field.next_cells
+        slots = np.array([s.slot for s in seekers], dtype=int)
+        reached = np.full(len(slots), -1)  # last cell each seeker reached, flat
+        start = kinematics.pos[:kinematics.size].copy()
+
+        done = 0
+        for _ in range(n):
+            if slots.size:
+                waypoint = kinematics.waypoint[slots]
+                arrived = np.flatnonzero((kinematics.pos[slots] == waypoint).all(axis=1))
+                if arrived.size:
+                    cols = np.abs(grid.xs[None, :] - waypoint[arrived, 0:1]).argmin(axis=1)
+                    rows = np.abs(grid.ys[None, :] - waypoint[arrived, 1:2]).argmin(axis=1)
+                    cells = rows * COL + cols
+                    nxt = next_cell[cells]
+                    if (nxt < 0).any():
+                        break  # that seeker falls back to a straight line, let its step pick it
+                    reached[arrived] = cells
+                    kinematics.waypoint[slots[arrived], 0] = grid.xs[nxt % COL]
+                    kinematics.waypoint[slots[arrived], 1] = grid.ys[nxt // COL]
+            kinematics.advance()
+            done += 1
+
+        # catch the seekers up with the cells they passed
+        for i in np.flatnonzero(reached >= 0).tolist():
+            seeker = seekers[i]
+            row, col = divmod(int(reached[i]), COL)
+            seeker.cell = (row, col)
+            seeker.target_distance = field.dist[row * COL + col] * seeker.cell_size
+            nxt = field.next_cells[row * COL + col]
+            seeker.next_target = grid[nxt // COL][nxt % COL]
+
+        if model.renderer.active:
+            size = min(len(start), kinematics.size)
+            moved = np.flatnonzero(np.any(kinematics.pos[:size] != start[:size], axis=1))
+            for slot in moved.tolist():
+                agent = kinematics.agents[slot]
+                if agent is not None:
+                    model.renderer.agent_moved(agent)
+        return done
@@ -0,0 +1,48 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+"""
+Shared test setup. The modules in src import each other absolutely, so
+src goes on the path like running from the src folder does.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+SHAPE = ROOT / "data" / "shape_files" / "zipfolder" / "Harbour_Depth_Area.shp"
+CONFIGS = ROOT / "configs"
+
+
+@pytest.fixture(scope="session")
+def world():
+    """(map, grid) of the harbour at 50 cells, built once without the map cache"""
+    import batch
+    return batch.build_world(SHAPE, 50, use_cache=False)
+
+
+@pytest.fixture(scope="session")
+def demo_spawns(world):
+    import batch
+    spawns, _ = batch.load_spawns(CONFIGS / "Demo.json", world[1])
+    return spawns
@@ -0,0 +1,47 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import contextlib
+import io
+
+import numpy as np
+
+import batch
+
+
+def run(spawns, world, seed, **kwargs):
+    # the model prints a lot every step
+    with contextlib.redirect_stdout(io.StringIO()):
+        summary, rows = batch.run_scenario(spawns, world, 300, seed=seed, **kwargs)
+    summary.pop("wall_time_s")
+    return summary, rows
+
+
+def test_seed_reproduces_run(world, demo_spawns):
+    np.random.seed(1)
+    first = run(demo_spawns, world, 7)
+    # the global numpy state must not leak into a seeded run
+    np.random.seed(2)
+    np.random.random(100)
+    assert run(demo_spawns, world, 7) == first
+
+
+def test_seeds_draw_different_detections(world, demo_spawns):
+    np.random.seed(0)
+    steps = {run(demo_spawns, world, seed)[0]["first_detection_step"] for seed in range(6)}
+    assert len(steps) > 1
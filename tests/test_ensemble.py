@@ -0,0 +1,34 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import pytest
+
+import ensemble
+
+
+def test_runs_must_be_positive():
+    with pytest.raises(SystemExit):
+        ensemble.parse_args(["Demo.json", "--shape", "map.shp", "--runs", "0"])
+    assert ensemble.parse_args(["Demo.json", "--shape", "map.shp", "--runs", "1"]).runs == 1
+
+
+def test_chunks_cover_every_seed():
+    seeds = list(range(10))
+    chunks = ensemble.chunk_seeds(seeds, workers=3)
+    assert sorted(s for chunk in chunks for s in chunk) == seeds
+    assert all(chunks)
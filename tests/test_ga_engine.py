@@ -0,0 +1,111 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import numpy as np
+import pytest
+
+from ga_engine import (ChromosomeExecutor, GENE_OFFSETS, GeneticSearch, Population, decode, encode,
+                       midpoint_crossover, mutate)
+
+
+def reference(water, start, genes):
+    """Gene by gene walk with the SearchAgent.get_next_pos rules, returns (final, failed, used)"""
+    rows, cols = water.shape
+    row, col = start
+    for i, gene in enumerate(genes):
+        r, c = row + GENE_OFFSETS[gene][0], col + GENE_OFFSETS[gene][1]
+        if not (0 <= r < rows and 0 <= c < cols) or not water[r, c]:
+            return (row, col), True, i + 1
+        row, col = r, c
+    return (row, col), False, len(genes)
+
+
+@pytest.fixture(scope="module")
+def water(world):
+    return world[1].water.astype(bool)
+
+
+def test_executor_matches_gene_by_gene_walk(water):
+    rng = np.random.default_rng(0)
+    cells = np.argwhere(water)
+    # include the edges so chromosomes walk off the grid too
+    edge = cells[(cells == 0).any(axis=1) | (cells == water.shape[0] - 1).any(axis=1)]
+    starts = np.concatenate([cells[rng.integers(0, len(cells), 300)], edge[rng.integers(0, len(edge), 100)]])
+    lengths = rng.integers(0, 61, len(starts))
+    genes = rng.integers(1, 5, (len(starts), 60)).astype(np.uint8)
+    genes[np.arange(60)[None, :] >= lengths[:, None]] = 0
+    result = ChromosomeExecutor(water).run(starts, genes, lengths, (3, 4))
+
+    for n, (start, chromosome) in enumerate(zip(starts.tolist(), genes.tolist())):
+        final, failed, used = reference(water, start, chromosome[:lengths[n]])
+        assert tuple(result.final[n]) == final
+        assert bool(result.failed[n]) == failed
+        assert result.used[n] == used
+        assert result.fitness[n] == abs(final[0] - 3) + abs(final[1] - 4)
+
+
+def test_encode_round_trips():
+    chromosomes = [list("LRUD"), list(), list("DDU")]
+    assert decode(*encode(chromosomes)) == chromosomes
+
+
+def test_midpoint_crossover_matches_mate():
+    rng = np.random.default_rng(1)
+    population = Population.random(8, rng)
+    letters = population.chromosomes()
+    a, b = [0, 1, 2, 0, 7], [3, 4, 5, 3, 7]
+    children = midpoint_crossover(population, a, b).chromosomes()
+    assert children == [letters[i][:len(letters[i]) // 2] + letters[j][len(letters[j]) // 2:] for i, j in zip(a, b)]
+
+
+def test_mutate_keeps_padding():
+    rng = np.random.default_rng(2)
+    population = Population.random(50, rng, 5, 20)
+    mutated = mutate(population, 0.5, rng)
+    past_end = np.arange(population.genes.shape[1])[None, :] >= population.lengths[:, None]
+    assert not mutated.genes[past_end].any()
+    assert np.isin(mutated.genes[~past_end], [1, 2, 3, 4]).all()
+    assert (mutated.genes != population.genes).any()
+
+
+def test_genetic_search_is_seeded_and_improves(water):
+    def search(seed):
+        return GeneticSearch(ChromosomeExecutor(water), (4, 31), pop_size=20,
+                             rng=np.random.default_rng(seed)).run(20)
+    first, again = search(3), search(3)
+    assert first.best_fitness == again.best_fitness
+    assert first.best() == again.best()
+    assert first.best_fitness[-1] < first.best_fitness[0]
+
+
+def test_unique_maps_back_to_every_row():
+    rng = np.random.default_rng(4)
+    population = Population.random(4, rng, 3, 8).take([0, 1, 0, 2, 1, 0, 3])
+    unique, inverse = population.unique()
+    assert len(unique.lengths) == 4
+    assert inverse[0] == inverse[2] == inverse[5] and inverse[1] == inverse[4]
+    assert unique.take(inverse).chromosomes() == population.chromosomes()
+
+
+def test_dedupe_matches_plain_search(water):
+    def search(dedupe):
+        return GeneticSearch(ChromosomeExecutor(water), (4, 31), pop_size=30, mutation_rate=0.05,
+                             rng=np.random.default_rng(6), dedupe=dedupe).run(15)
+    plain, deduped = search(False), search(True)
+    assert deduped.best_fitness == plain.best_fitness
+    assert deduped.best() == plain.best()
@@ -0,0 +1,57 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import numpy as np
+import pytest
+
+import ga_pool
+
+# open water with the target in the corner, a group starting far from it
+WATER = np.ones((20, 20), dtype=bool)
+STARTS = [(15, 15)]
+
+
+def test_default_islands_evolve():
+    results = ga_pool.run_islands(WATER, STARTS, 30, seed=1, workers=1)
+    history = results[0]["island_fitness_history"]
+    # pop 10 can't feed the default 4 islands past the elite, fewer are used
+    assert 1 <= len(history) < 4
+    assert all(len(h) == 30 for h in history)
+    assert results[0]["best_fitness"] < min(h[0] for h in history)
+
+
+def test_islands_need_children():
+    with pytest.raises(ValueError):
+        ga_pool.run_islands(WATER, STARTS, 5, pop_size=2, workers=1)
+
+
+def test_islands_ignore_worker_count():
+    one = ga_pool.run_islands(WATER, STARTS, 12, islands=3, interval=4, pop_size=30, seed=5, workers=1)
+    two = ga_pool.run_islands(WATER, STARTS, 12, islands=3, interval=4, pop_size=30, seed=5, workers=2)
+    assert one == two
+
+
+def test_migration_replaces_the_worst():
+    islands = list()
+    for fill in (1, 2, 3):
+        genes = np.full((4, 3), fill, dtype=np.uint8)
+        islands.append({"population": ga_pool.Population(genes, np.full(4, 3))})
+    ga_pool.migrate(islands, 2, "ring")
+    # island 1 keeps its best 2 and takes island 0's best 2
+    assert islands[1]["population"].genes[:, 0].tolist() == [2, 2, 1, 1]
+    assert islands[0]["population"].genes[:, 0].tolist() == [1, 1, 3, 3]
@@ -0,0 +1,100 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import contextlib
+import io
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from conftest import SHAPE
+from grid import Grid
+from map import MapControl
+from map_cache import MapCache
+
+
+@pytest.fixture
+def shape(tmp_path):
+    """A copy of the harbour shapefile that the test can change"""
+    folder = tmp_path / "shape"
+    folder.mkdir()
+    for part in SHAPE.parent.glob(SHAPE.stem + ".*"):
+        shutil.copy(part, folder / part.name)
+    return folder / SHAPE.name
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Counts the shapefile parses"""
+    calls = list()
+    read = MapControl.read_shapefile
+
+    def counted(self, shape_path):
+        calls.append(shape_path)
+        return read(self, shape_path)
+    monkeypatch.setattr(MapControl, "read_shapefile", counted)
+    return calls
+
+
+def build(shape, cache):
+    with contextlib.redirect_stdout(io.StringIO()):
+        world_map = MapControl(canvas=None, shape_path=shape, cache=cache)
+        return Grid(width=700, height=700, cells_n=50, map=world_map)
+
+
+def test_second_build_is_a_hit(tmp_path, shape, parses):
+    cache = MapCache(tmp_path / "cache")
+    first = build(shape, cache)
+    assert len(parses) == 1
+    assert len(list((tmp_path / "cache").glob("*.npz"))) == 2
+    second = build(shape, MapCache(tmp_path / "cache"))
+    assert len(parses) == 1
+    assert np.array_equal(first.water, second.water)
+    assert np.array_equal(build(shape, None).water, first.water)
+
+
+def test_changed_shapefile_is_a_miss(tmp_path, shape, parses):
+    build(shape, MapCache(tmp_path / "cache"))
+    with open(shape.with_suffix(".cpg"), "a", encoding="utf-8") as fh:
+        fh.write("\n")
+    build(shape, MapCache(tmp_path / "cache"))
+    assert len(parses) == 2
+    assert len(list((tmp_path / "cache").glob("*.npz"))) == 4
+
+
+def test_bad_cache_file_is_a_miss(tmp_path, shape, parses):
+    cache = MapCache(tmp_path / "cache")
+    build(shape, cache)
+    for path in (tmp_path / "cache").glob("map_*.npz"):
+        path.write_bytes(b"not an npz")
+    rebuilt = build(shape, MapCache(tmp_path / "cache"))
+    assert len(parses) == 2
+    assert rebuilt.water.any()
+
+
+def test_concurrent_saves_leave_one_whole_file(tmp_path, capsys):
+    cache = MapCache(tmp_path / "cache")
+    path = cache.grid_path("abc", (700, 700), 50)
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda n: cache.save(path, water=np.full((500, 500), n % 2 == 0)), range(32)))
+    assert "Could not write" not in capsys.readouterr().out
+    assert [p.name for p in (tmp_path / "cache").iterdir()] == [path.name]
+    water = cache.load(path)["water"]
+    assert water.shape == (500, 500) and (water.all() or not water.any())
@@ -0,0 +1,71 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import contextlib
+import io
+from collections import defaultdict
+
+import pytest
+
+import batch
+from agents.model import UUVModel
+from conftest import CONFIGS
+
+
+@pytest.fixture(scope="module")
+def ga_spawns(world):
+    spawns, _ = batch.load_spawns(CONFIGS / "demo2.json", world[1])
+    return {"attacker": [e for e in spawns["attacker"] if e["type"] == "GA"], "defender": []}
+
+
+def ga_state(spawns, world, ga_fast, generations=4):
+    with contextlib.redirect_stdout(io.StringIO()):
+        model = UUVModel(spawns=spawns, map=world[0], grid=world[1], seed=3, ga_fast=ga_fast)
+        while model.current_generation < generations:
+            model.step()
+    return sorted((a.unique_id, tuple(a.chromosone), tuple(a.grid_index), a.is_failed) for a in model.agents)
+
+
+def test_fast_ga_matches_stepped_ga(world, ga_spawns):
+    assert ga_state(ga_spawns, world, ga_fast=True) == ga_state(ga_spawns, world, ga_fast=False)
+
+
+def by_step(rows):
+    steps = defaultdict(list)
+    for row in rows:
+        steps[row[0]].append(row)
+    return steps
+
+
+@pytest.mark.parametrize("config", ["Demo.json", "test.json"])
+@pytest.mark.parametrize("seed", [1, 2])
+def test_event_skip_matches_fixed_steps(world, config, seed):
+    spawns, _ = batch.load_spawns(CONFIGS / config, world[1])
+    runs = list()
+    for event_skip in (False, True):
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary, rows = batch.run_scenario(spawns, world, 400, seed=seed, event_skip=event_skip)
+        summary.pop("wall_time_s")
+        runs.append((summary, by_step(rows), summary.pop("skipped_steps")))
+    (fixed, fixed_rows, _), (skipped, skipped_rows, n_skipped) = runs
+    assert n_skipped > 0
+    assert skipped == fixed
+    # skipped steps leave no rows, every step that ran matches the fixed step run
+    assert skipped_rows.keys() <= fixed_rows.keys()
+    for step, rows in skipped_rows.items():
+        assert rows == fixed_rows[step]
@@ -0,0 +1,92 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import math
+
+import numpy as np
+import pytest
+
+from pathfinding import FlowField, PathEngine, SQRT2
+
+
+def path_cost(path):
+    return sum(SQRT2 if r0 != r1 and c0 != c1 else 1.0 for (r0, c0), (r1, c1) in zip(path, path[1:]))
+
+
+def test_search_builds_neighbours_on_first_use():
+    water = np.ones((6, 8), dtype=bool)
+    water[1:5, 3] = False  # wall with gaps at both ends
+    engine = PathEngine(water)
+    assert engine.neighbours is None
+    assert engine.adjacency.shape == (48, 48)
+    path = engine.search((3, 1), (3, 6))
+    assert engine.neighbours is not None
+    assert path[0] == (3, 1) and path[-1] == (3, 6)
+    assert all(water[r, c] for r, c in path)
+    # diagonally round the bottom of the wall and back up
+    assert path_cost(path) == pytest.approx(1 + 4 * SQRT2)
+
+
+def test_search_rejects_land_and_unreachable_goals():
+    water = np.ones((4, 4), dtype=bool)
+    water[:, 2] = False
+    engine = PathEngine(water)
+    assert engine.search((0, 0), (0, 2)) is None
+    assert engine.search((0, 0), (9, 9)) is None
+    assert engine.search((0, 0), (0, 3)) is None
+    assert engine.search((1, 1), (1, 1)) is None
+    assert math.isclose(path_cost(engine.search((0, 0), (3, 1))), 2 + SQRT2)
+
+
+@pytest.fixture(scope="module")
+def grid(world):
+    return world[1]
+
+
+def test_flow_field_distances_match_a_star(grid):
+    rng = np.random.default_rng(0)
+    cells = [tuple(c) for c in np.argwhere(grid.water.astype(bool)).tolist()]
+    sources = [cells[i] for i in rng.choice(len(cells), 3, replace=False)]
+    field = FlowField(grid)
+    field.build(sources)
+    engine = grid.path_engine
+    for i in rng.choice(len(cells), 40, replace=False):
+        cell = cells[i]
+        costs = list()
+        for source in sources:
+            path = [cell] if cell == source else engine.search(cell, source)
+            costs.append(path_cost(path) if path is not None else math.inf)
+        assert field.distance(*cell) == pytest.approx(min(costs))
+
+
+def test_flow_field_steps_reach_a_source(grid):
+    cells = [tuple(c) for c in np.argwhere(grid.water.astype(bool)).tolist()]
+    source = cells[len(cells) // 2]
+    field = FlowField(grid)
+    field.build([source])
+    for start in cells[::37]:
+        if math.isinf(field.distance(*start)):
+            assert field.next_step(*start) is None
+            continue
+        cell, walked = start, 0.0
+        while cell != source:
+            nxt = field.next_step(*cell)
+            walked += path_cost([cell, nxt])
+            cell = nxt
+        assert walked == pytest.approx(field.distance(*start))
+    assert field.distance(*source) == 0
@@ -0,0 +1,76 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import numpy as np
+
+from recorder import ColumnTable, StepRecorder
+
+DTYPES = {"step": np.int64, "x": np.float64}
+
+
+def fill(table, steps):
+    for step in steps:
+        table.append({"step": [step] * 3, "x": [step / 2] * 3}, 3)
+
+
+def test_spilled_chunks_read_back(tmp_path):
+    table = ColumnTable(DTYPES, chunk_rows=4, spill_dir=tmp_path)
+    fill(table, range(10))
+    assert any(not isinstance(chunk, dict) for chunk in table.chunks)
+    assert table.column("step").tolist() == [s for s in range(10) for _ in range(3)]
+    assert table.rows == 30
+
+
+def test_blocks_stay_in_one_chunk():
+    table = ColumnTable(DTYPES, chunk_rows=4)
+    fill(table, range(3))
+    start, stop = table.append({"step": [9] * 6, "x": [0.0] * 6}, 6)
+    assert table.view(start, stop)["step"].tolist() == [9] * 6
+
+
+class Agent:
+    def __init__(self, unique_id, position):
+        self.unique_id = unique_id
+        self.position = position
+
+
+class Model:
+    def __init__(self, agents):
+        self.agents = agents
+        self.steps = 0
+
+
+def record(recorder, steps, offset):
+    model = Model([Agent(1, (offset, 0.0)), Agent(2, (offset + 1, 0.0))])
+    for step in range(steps):
+        model.steps = step
+        recorder.collect(model)
+
+
+def test_recorders_keep_their_own_spills(tmp_path):
+    first = StepRecorder({"seeker": Agent}, chunk_rows=4, spill_dir=tmp_path)
+    record(first, 10, 0.0)
+    first.agent_table.seal()
+    # reset_sim builds a new recorder on the same folder
+    second = StepRecorder({"seeker": Agent}, chunk_rows=4, spill_dir=tmp_path)
+    record(second, 10, 100.0)
+    second.agent_table.seal()
+    assert first.run_dir != second.run_dir
+    assert first.get_agent_vars_dataframe()["x"].max() == 1.0
+    assert second.get_agent_vars_dataframe()["x"].min() == 100.0
+    assert len(first.get_agent_vars_dataframe()) == 20
@@ -0,0 +1,38 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import subprocess
+import sys
+
+from conftest import CONFIGS, SHAPE, SRC
+
+HEADLESS_RUN = f"""
+import contextlib, io, sys
+import batch
+world = batch.build_world({str(SHAPE)!r}, 50, use_cache=False)
+spawns, _ = batch.load_spawns({str(CONFIGS / "Demo.json")!r}, world[1])
+with contextlib.redirect_stdout(io.StringIO()):
+    batch.run_scenario(spawns, world, 50, seed=1)
+print("tkinter" in sys.modules)
+"""
+
+
+def test_headless_run_never_imports_tk():
+    # a fresh interpreter, the test session may have tkinter loaded already
+    out = subprocess.run([sys.executable, "-c", HEADLESS_RUN], cwd=SRC, capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == "False"
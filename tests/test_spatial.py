@@ -0,0 +1,84 @@
+# --- Project Information ---
+# Project: UUV Simulation Framework
+# Version: 1.0.0
+# Date: November 2025
+#
+# --- Authors and Contributors ---
+# Primary:
+# - Gunner Cook-Dumas (SCRUM Manager, Backend, Agent, Model, and GA Stucture)
+# - Justin Mosman (developer)
+# - Michael Cardinal (developer)
+#
+# Secondary:
+# - Lauren Milne (SCRUM Product Owner)
+#
+# --- Reviewers/Bosses ---
+# - Prof. Lance Fiondella, ECE, University of Massachusetts Dartmouth
+# - Prof. Hang Dinh, CIS, Indiana University South Bend
+
+import numpy as np
+import pytest
+
+from spatial import SpatialIndex, segment_distance
+
+
+class Agent:
+    def __init__(self, unique_id, position, prev_position=None):
+        self.unique_id = unique_id
+        self.position = np.asarray(position, dtype=float)
+        if prev_position is not None:
+            self.prev_position = np.asarray(prev_position, dtype=float)
+def test_segment_distance():
+    starts = [[0, 0], [0, 0], [0, 0], [2, 2]]
+    ends = [[10, 0], [10, 0], [10, 0], [2, 2]]
+    points = [[5, 3], [-4, 3], [13, 4], [5, 6]]
+    assert segment_distance(starts, ends, points).tolist() == pytest.approx([3, 5, 5, 5])
+
+
+def test_swept_query_catches_fast_movers():
+    index = SpatialIndex()
+    # moved from one side of the point to the other in a single step
+    fast = Agent(1, (20, 0), prev_position=(-20, 0))
+    slow = Agent(2, (3, 4))
+    far = Agent(3, (40, 40), prev_position=(30, 30))
+    index.rebuild({"seeker": [far, slow, fast]})
+
+    point = [[0, 0]]
+    assert [a.unique_id for a, _ in index.query_radius_many("seeker", point, 5)[0]] == [2]
+    swept = index.query_swept_many("seeker", point, 5)[0]
+    assert [a.unique_id for a, _ in swept] == [1, 2]
+    assert [d for _, d in swept] == pytest.approx([0, 5])
+    assert [a.unique_id for a, _ in index.query_swept_many("seeker", point, 5, strict=True)[0]] == [1]
+
+
+def test_swept_query_without_movement_matches_radius():
+    rng = np.random.default_rng(0)
+    agents = [Agent(i, p) for i, p in enumerate(rng.uniform(0, 100, (200, 2)))]
+    index = SpatialIndex()
+    index.rebuild({"seeker": agents, "target": []})
+    points = rng.uniform(0, 100, (20, 2))
+    plain = index.query_radius_many("seeker", points, 12)
+    swept = index.query_swept_many("seeker", points, 12)
+    assert [[a.unique_id for a, _ in hits] for hits in plain] == [[a.unique_id for a, _ in hits] for hits in swept]
+
+
+def test_radius_query_matches_brute_force():
+    rng = np.random.default_rng(0)
+    agents = [Agent(i, p) for i, p in enumerate(rng.uniform(0, 100, (200, 2)))]
+    index = SpatialIndex()
+    index.rebuild({"seeker": agents, "target": []})
+    points = rng.uniform(0, 100, (20, 2))
+    for point, hits in zip(points, index.query_radius_many("seeker", points, 12)):
+        expected = [a.unique_id for a in agents if np.hypot(*(a.position - point)) <= 12]
+        assert [a.unique_id for a, _ in hits] == expected
+        assert [d for _, d in hits] == pytest.approx([np.hypot(*(a.position - point)) for a, _ in hits])
+    assert index.count(("seeker", "target")) == 200
+
+
+def test_nearest():
+    index = SpatialIndex()
+    index.rebuild({"target": [Agent(1, (10, 0)), Agent(2, (0, 3))]})
+    agent, dist = index.nearest("target", (0, 0))
+    assert agent.unique_id == 2 and dist == pytest.approx(3)
+    assert index.nearest("target", (0, 0), max_distance=2) == (None, np.inf)
+    assert index.nearest("seeker", (0, 0)) == (None, np.inf)